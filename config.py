@@ -8,9 +8,13 @@ LLM/embedding models. Settings can be overridden via environment variables.
 import os
 
 from dotenv import load_dotenv
-from llama_index.embeddings.ollama import OllamaEmbedding
+from llama_index.core.llms import ChatMessage
 from llama_index.llms.ollama import Ollama
 
+from utils.embed_cache import EmbeddingCache
+from utils.embeddings import BatchedOllamaEmbedding
+from utils.logger import setup_logger
+
 # load environment variables from .env file
 load_dotenv()
 
@@ -22,6 +26,18 @@ WIKIPEDIA_USER_AGENT = os.getenv("WIKIPEDIA_USER_AGENT", "ConQuerX-Research/1.0"
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "gemma3:4b")
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "embeddinggemma")
 
+# how long Ollama keeps models loaded after a request
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "1h")
+
+# max concurrent requests sent to Ollama; match the server's OLLAMA_NUM_PARALLEL
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+# number of prompt-length bins submitted as separate concurrent waves (quiz step)
+BATCH_BINS = int(os.getenv("BATCH_BINS", "3"))
+
+# chunks per /api/embed request (32 suits CPU/MPS, 128 suits CUDA)
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "32"))
+
 # ============================================================================
 # File Paths
 # ============================================================================
@@ -34,7 +50,9 @@ WIKI_FILE = "wiki.json"
 EVALUATION_FILE = "wiki_evaluation.json"
 LOG_FILE = "pipeline.log"
 CACHE_DIR = ".cache/wikipedia"
-INDEX_DIR = ".indices"
+EMBED_CACHE_DIR = ".cache/embeddings"
+LLM_CACHE_DIR = ".cache/llm"
+SEMANTIC_CACHE_DIR = ".cache/semantic"
 
 # ============================================================================
 # LLM Settings
@@ -44,6 +62,20 @@ RETRIEVAL_TOP_K = 5
 CHUNK_SIZE = 128
 CHUNK_OVERLAP = 50
 
+# opt-in: areas whose name embeddings are at least this similar share seed
+# questions (unset to treat every area separately)
+SEMANTIC_THRESHOLD = (
+    float(os.environ["SEMANTIC_THRESHOLD"]) if os.getenv("SEMANTIC_THRESHOLD") else None
+)
+
+# token caps per call site: concept lists and evaluation scores are short,
+# so cap generated tokens and fail fast; summaries and quizzes run long
+CONCEPTS_NUM_PREDICT = 128
+EVAL_NUM_PREDICT = 256
+QUIZ_NUM_PREDICT = 1024
+STRUCTURED_REQUEST_TIMEOUT = 30.0
+QUIZ_REQUEST_TIMEOUT = 120.0
+
 # ============================================================================
 # Education Levels
 # ============================================================================
@@ -61,7 +93,8 @@ RETRY_BASE_DELAY = 1.0
 # Rate Limiting
 # ============================================================================
 
-WIKIPEDIA_DELAY = 0.1  # seconds between API calls
+WIKIPEDIA_RATE_LIMIT = 10.0  # max API calls per second
+WIKIPEDIA_CONCURRENCY = 8  # max concurrent page fetches
 
 # ============================================================================
 # Initialized Objects
@@ -71,5 +104,61 @@ LLM = Ollama(
     model=OLLAMA_MODEL,
     request_timeout=120.0,
     json_mode=True,
+    keep_alive=OLLAMA_KEEP_ALIVE,
 )
-EMBED_MODEL = OllamaEmbedding(model_name=EMBEDDING_MODEL)
+# concept extraction: a single bracketed list, so stop at its closing bracket
+LLM_CONCEPTS = Ollama(
+    model=OLLAMA_MODEL,
+    request_timeout=STRUCTURED_REQUEST_TIMEOUT,
+    json_mode=False,
+    keep_alive=OLLAMA_KEEP_ALIVE,
+    additional_kwargs={
+        "temperature": 0.1,
+        "num_predict": CONCEPTS_NUM_PREDICT,
+        "stop": ["]"],
+    },
+)
+# summary and quiz generation (free-form text)
+LLM_QUIZ = Ollama(
+    model=OLLAMA_MODEL,
+    request_timeout=QUIZ_REQUEST_TIMEOUT,
+    json_mode=False,
+    keep_alive=OLLAMA_KEEP_ALIVE,
+    additional_kwargs={"temperature": 0.7, "num_predict": QUIZ_NUM_PREDICT},
+)
+# evaluation scores (JSON object)
+LLM_EVAL = Ollama(
+    model=OLLAMA_MODEL,
+    request_timeout=STRUCTURED_REQUEST_TIMEOUT,
+    json_mode=True,
+    keep_alive=OLLAMA_KEEP_ALIVE,
+    additional_kwargs={"temperature": 0.0, "num_predict": EVAL_NUM_PREDICT},
+)
+EMBED_MODEL = BatchedOllamaEmbedding(
+    model_name=EMBEDDING_MODEL,
+    embed_batch_size=EMBED_BATCH_SIZE,
+    keep_alive=OLLAMA_KEEP_ALIVE,
+    cache=EmbeddingCache(cache_dir=EMBED_CACHE_DIR),
+)
+
+logger = setup_logger(__name__, log_file=LOG_FILE)
+
+
+def warmup(embeddings: bool = True) -> None:
+    """
+    Load models into Ollama before the pipeline starts.
+    
+    Issues a tiny request to each model so the first real request of each
+    step doesn't pay the model load time. Models then stay resident for
+    OLLAMA_KEEP_ALIVE. Failures are logged and otherwise ignored.
+    
+    Args:
+        embeddings: Also warm up the embedding model
+    """
+    try:
+        LLM.chat(messages=[ChatMessage(role="user", content="ok")])
+        if embeddings:
+            EMBED_MODEL.get_text_embedding("ok")
+        logger.debug("Ollama models warmed up")
+    except Exception as e:
+        logger.warning(f"Model warm-up failed: {e}")
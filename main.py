@@ -1,7 +1,7 @@
 import argparse
 import sys
 
-from config import CACHE_DIR, LOG_FILE
+from config import CACHE_DIR, LOG_FILE, SEMANTIC_THRESHOLD, warmup
 from pipeline.concepts import extract_concepts
 from pipeline.evaluation import evaluate
 from pipeline.quiz import generate_quiz
@@ -73,6 +73,13 @@ def main(step: str = "all", verbose: bool = False, clear_cache: bool = False) ->
     logger.info("=" * 60)
 
     try:
+        # load models once up front so no step pays the cold start
+        logger.info("Warming up Ollama models")
+        warmup(
+            embeddings=step in ["quiz", "all"]
+            or (step == "seed" and SEMANTIC_THRESHOLD is not None)
+        )
+
         if step in ["seed", "all"]:
             logger.info("Step 1/4: Seeding questions")
             seed_questions()
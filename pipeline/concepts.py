@@ -5,62 +5,153 @@ Extracts key concepts from each generated question using an LLM.
 Concepts are nouns representing topics relevant to the question.
 """
 
-import json
-from typing import Dict, List
+import asyncio
+from typing import Any, Dict, List, Tuple
 
-from config import LLM, LOG_FILE
+from config import (LLM_CONCEPTS, LOG_FILE, MAX_RETRIES, OLLAMA_NUM_PARALLEL,
+                    RETRY_BASE_DELAY)
 from llama_index.core.llms import ChatMessage
-from prompts import CONCEPT_GENERATION_PROMPT
+from prompts import concept_prompt
 from tqdm import tqdm
+from utils.concurrency import gather_bounded, run_async
+from utils.io import dump_json_streaming, load_json
 from utils.logger import setup_logger
+from utils.retry import retried
 from utils.validation import validate_concepts
 
 logger = setup_logger(__name__, log_file=LOG_FILE)
 
 
+@retried(max_retries=MAX_RETRIES, base_delay=RETRY_BASE_DELAY)
+async def _request_concepts(prompt: str) -> List[str]:
+    """
+    Request the concept list for a question, retrying on failure.
+    
+    Args:
+        prompt: Formatted concept extraction prompt
+        
+    Returns:
+        Concepts parsed from the response (not yet validated)
+    """
+    response = await LLM_CONCEPTS.achat(
+        messages=[ChatMessage(role="user", content=prompt)]
+    )
+    
+    # parse concept list from LLM response
+    # the closing bracket is usually consumed by the stop sequence
+    answer = response.message.content.strip().strip("[]").split(", ")
+    return [c.strip() for c in answer if c.strip()]
+
+
+async def _extract_concepts(prompt: str) -> List[str]:
+    """
+    Extract concepts for a single question.
+    
+    Args:
+        prompt: Formatted concept extraction prompt
+        
+    Returns:
+        Concepts from the response, or an empty list if every attempt failed
+    """
+    try:
+        return await _request_concepts(prompt)
+    except Exception as e:
+        logger.error(f"Failed to extract concepts after {MAX_RETRIES} attempts: {e}")
+        return []
+
+
+async def _extract_area_concepts(
+    level: str,
+    area: str,
+    question_list: List[str],
+    semaphore: asyncio.Semaphore,
+) -> List[List[str]]:
+    """
+    Extract concepts for all questions in an area concurrently.
+    
+    Requests are not binned by length: areas run concurrently on one
+    semaphore, so per-area waves would interleave anyway.
+    
+    Args:
+        level: Education level of the questions
+        area: Subject area of the questions
+        question_list: Questions to extract concepts from
+        semaphore: Limits concurrent LLM requests across all areas
+        
+    Returns:
+        List of concept lists, one per question (in input order)
+    """
+    prompts = [
+        concept_prompt(question, level, area)
+        for question in question_list
+    ]
+
+    responses = await gather_bounded(
+        (_extract_concepts(prompt) for prompt in prompts), semaphore
+    )
+
+    return [validate_concepts(concepts) for concepts in responses]
+
+
+async def _extract_level_concepts(level: str, areas: Dict[str, Any]) -> None:
+    """
+    Extract concepts for every area of a level, running areas concurrently.
+    
+    Areas share one semaphore sized to OLLAMA_NUM_PARALLEL, so the total
+    number of in-flight LLM requests stays bounded. Each area's entry in
+    `areas` is replaced with its questions and concepts as it completes.
+    
+    Args:
+        level: Education level
+        areas: Mapping of area name to question list (updated in place)
+    """
+    semaphore = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+
+    async def run_area(
+        area: str, question_list: List[str]
+    ) -> Tuple[str, List[str], List[List[str]]]:
+        concepts = await _extract_area_concepts(level, area, question_list, semaphore)
+        return area, question_list, concepts
+
+    # snapshot since area entries are replaced below
+    tasks = [
+        run_area(area, question_list) for area, question_list in list(areas.items())
+    ]
+
+    for next_done in tqdm(
+        asyncio.as_completed(tasks), total=len(tasks), desc=f"{level}"
+    ):
+        area, question_list, concepts = await next_done
+
+        # create new structure for area data, assigned once per area
+        areas[area] = {
+            "questions": question_list,
+            "concepts": concepts
+        }
+
+
 def extract_concepts() -> None:
     """
     Extract key concepts from generated questions.
     
     Reads questions from questions.json and uses an LLM to identify key concepts
     for each question. Concepts are nouns or noun phrases relevant to the question's
-    subject matter. Output is saved to concepts.json.
+    subject matter. All areas of a level and all questions in an area are sent
+    to Ollama concurrently (bounded by OLLAMA_NUM_PARALLEL). Output is saved
+    to concepts.json.
     
     Raises:
         FileNotFoundError: If questions.json doesn't exist
         IOError: If unable to write concepts.json
     """
     logger.info("Reading questions from questions.json")
-    with open("questions.json", "r") as f:
-        questions: Dict[str, Dict[str, List[str]]] = json.loads(f.read())
+    questions: Dict[str, Dict[str, List[str]]] = load_json("questions.json")
 
     for level, areas in questions.items():
         logger.info(f"Extracting concepts for {level} level")
-        
-        for area, question_list in tqdm(areas.items(), desc=f"{level}"):
-            # create new structure for area data
-            areas[area] = {
-                "questions": question_list,
-                "concepts": []
-            }
-
-            for question in question_list:
-                prompt = CONCEPT_GENERATION_PROMPT.format(question, level, area)
-
-                response = LLM.chat(
-                    messages=[
-                        ChatMessage(role="user", content=prompt),
-                    ]
-                )
-
-                # parse concept list from LLM response
-                answer = response.message.content.strip("[]").split(", ")
-                concepts = [i.strip() for i in answer if i.strip()]
-                concepts = validate_concepts(concepts)
-                areas[area]["concepts"].append(concepts)
+        run_async(_extract_level_concepts(level, areas))
 
     logger.info("Writing concepts to concepts.json")
-    with open("concepts.json", "w") as f:
-        f.write(json.dumps(questions, indent=4))
+    dump_json_streaming("concepts.json", questions)
     
     logger.info("Concept extraction completed successfully")
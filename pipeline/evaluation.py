@@ -6,17 +6,23 @@ diversity, area relevance, difficulty appropriateness, and comprehensiveness.
 Uses an LLM to assign scores from 1-5 for each dimension.
 """
 
+import asyncio
 import json
-import re
-from typing import Dict, List, Any
+import os
+from typing import Dict, List, Any, Tuple
 
+import ijson
+import orjson
 from llama_index.core.llms import ChatMessage
 from tqdm import tqdm
 
-from config import LLM, LOG_FILE, MAX_RETRIES, RETRY_BASE_DELAY
-from prompts import EVALUATION_PROMPT
+from config import (LLM_EVAL, LOG_FILE, MAX_RETRIES, OLLAMA_NUM_PARALLEL,
+                    RETRY_BASE_DELAY)
+from prompts import evaluation_prompt
+from utils.concurrency import gather_bounded, run_async
+from utils.io import dump_json_streaming, iter_json_items, load_json
 from utils.logger import setup_logger
-from utils.retry import retry_with_backoff
+from utils.retry import retried
 
 logger = setup_logger(__name__, log_file=LOG_FILE)
 
@@ -29,6 +35,16 @@ EVALUATION_DIMENSIONS = [
     "Comprehensiveness",
 ]
 
+# JSON schema the evaluation response is constrained to (Ollama `format`)
+EVAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        dim: {"type": "integer", "minimum": 1, "maximum": 5}
+        for dim in EVALUATION_DIMENSIONS
+    },
+    "required": EVALUATION_DIMENSIONS,
+}
+
 
 def _create_score_dict(score: int) -> Dict[str, int]:
     """
@@ -43,13 +59,161 @@ def _create_score_dict(score: int) -> Dict[str, int]:
     return {dim: score for dim in EVALUATION_DIMENSIONS}
 
 
+@retried(max_retries=MAX_RETRIES, base_delay=RETRY_BASE_DELAY)
+async def _request_scores(prompt: str) -> Dict[str, int]:
+    """
+    Request evaluation scores for a quiz set, retrying on failure.
+    
+    Calls LLM to evaluate quiz, with output constrained to EVAL_SCHEMA,
+    so the response is parsed directly as JSON.
+    
+    Args:
+        prompt: Formatted evaluation prompt
+        
+    Returns:
+        Dictionary with evaluation scores
+        
+    Raises:
+        ValueError: If response is empty
+        orjson.JSONDecodeError: If JSON is malformed (e.g. truncated)
+    """
+    response = await LLM_EVAL.achat(
+        messages=[ChatMessage(role="user", content=prompt)],
+        format=EVAL_SCHEMA,
+    )
+    
+    response_content = response.message.content
+    
+    if not response_content:
+        raise ValueError("Empty response from LLM")
+    
+    scores = orjson.loads(response_content)
+    
+    return {dim: scores[dim] for dim in EVALUATION_DIMENSIONS}
+
+
+async def _evaluate_quiz(prompt: str) -> Dict[str, int]:
+    """
+    Evaluate a single quiz set.
+    
+    Args:
+        prompt: Formatted evaluation prompt
+        
+    Returns:
+        Dictionary with evaluation scores, or -1 for all dimensions
+        if every attempt failed
+    """
+    try:
+        return await _request_scores(prompt)
+    except Exception as e:
+        logger.error(f"Failed to evaluate quiz after {MAX_RETRIES} attempts: {e}")
+        # assign error marker (-1) for all dimensions
+        return _create_score_dict(-1)
+
+
+async def _evaluate_area(
+    level: str,
+    area: str,
+    questions: List[str],
+    quiz_lists: List[List[str]],
+    summaries: List[str],
+    semaphore: asyncio.Semaphore,
+) -> List[Dict[str, int]]:
+    """
+    Evaluate all quiz sets in an area concurrently.
+    
+    Requests are not binned by length: areas run concurrently on one
+    semaphore, so per-area waves would interleave anyway.
+    
+    Args:
+        level: Education level of the questions
+        area: Subject area of the questions
+        questions: Seed questions
+        quiz_lists: Generated quizzes for each question
+        summaries: Wikipedia summary for each question
+        semaphore: Semaphore bounding in-flight LLM requests across areas
+        
+    Returns:
+        Evaluation scores for each question (in input order)
+    """
+    llm_evaluation_metrics: List[Dict[str, int]] = []
+    prompts: List[str] = []
+    prompt_indices: List[int] = []
+
+    for question, quiz_list, wiki in zip(questions, quiz_lists, summaries):
+        # skip if no quizzes were generated
+        if not quiz_list:
+            llm_evaluation_metrics.append(_create_score_dict(0))
+            continue
+
+        # aggregate all quizzes for this question
+        aggregated_quiz = "\n\n".join(
+            f"{i+1}: {quiz}" for i, quiz in enumerate(quiz_list)
+        )
+
+        prompt = evaluation_prompt(area, level, question, wiki, aggregated_quiz)
+        prompt_indices.append(len(llm_evaluation_metrics))
+        prompts.append(prompt)
+        # placeholder, filled in once the evaluations complete
+        llm_evaluation_metrics.append({})
+
+    evaluations = await gather_bounded(
+        (_evaluate_quiz(prompt) for prompt in prompts), semaphore
+    )
+    for i, evaluation_dict in zip(prompt_indices, evaluations):
+        llm_evaluation_metrics[i] = evaluation_dict
+
+    return llm_evaluation_metrics
+
+
+async def _evaluate_level(
+    level: str, areas: Dict[str, Any], wiki_summaries: Dict[str, List[str]]
+) -> None:
+    """
+    Evaluate every area of a level, running areas concurrently.
+    
+    Areas share one semaphore sized to OLLAMA_NUM_PARALLEL, so the total
+    number of in-flight LLM requests stays bounded. Scores are stored
+    under each area's "llm_score" key as it completes.
+    
+    Args:
+        level: Education level
+        areas: Mapping of area name to quiz data (updated in place)
+        wiki_summaries: Wikipedia summaries for each area to evaluate
+    """
+    semaphore = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+
+    async def run_area(
+        area: str, summaries: List[str]
+    ) -> Tuple[str, List[Dict[str, int]]]:
+        area_data = areas[area]
+        scores = await _evaluate_area(
+            level,
+            area,
+            area_data["questions"],
+            area_data["quiz"],
+            summaries,
+            semaphore,
+        )
+        return area, scores
+
+    tasks = [run_area(area, summaries) for area, summaries in wiki_summaries.items()]
+
+    for next_done in tqdm(
+        asyncio.as_completed(tasks), total=len(tasks), desc=f"{level}"
+    ):
+        area, llm_evaluation_metrics = await next_done
+        areas[area]["llm_score"] = llm_evaluation_metrics
+
+
 def evaluate() -> None:
     """
     Evaluate generated quizzes using LLM-based assessment.
     
     For each quiz set:
-    1. Retrieves corresponding Wikipedia summary
-    2. Submits quiz to LLM for evaluation
+    1. Retrieves corresponding Wikipedia summary (streamed from wiki.json
+       one area at a time to bound memory)
+    2. Submits quiz to LLM for evaluation (areas of a level run concurrently)
     3. Extracts scores for 5 dimensions (1-5 scale each):
        - Educational Value
        - Diversity
@@ -64,23 +228,15 @@ def evaluate() -> None:
         FileNotFoundError: If required input files don't exist
         IOError: If unable to write output file
     """
-    # load Wikipedia summaries for evaluation context
-    logger.info("Reading Wikipedia summaries from wiki.json")
-    try:
-        with open("wiki.json", "r") as f:
-            wiki_information: Dict[str, Dict[str, Dict[str, List[str]]]] = json.loads(f.read())
-    except FileNotFoundError:
+    # Wikipedia summaries are streamed per area below, only check they exist
+    if not os.path.exists("wiki.json"):
         logger.error("wiki.json not found. Run quiz generation first (python main.py --step quiz)")
-        raise
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in wiki.json: {e}")
-        raise
+        raise FileNotFoundError("wiki.json")
 
     # load quiz data for evaluation
     logger.info("Reading quiz data from quiz_concept_wiki.json")
     try:
-        with open("quiz_concept_wiki.json", "r") as f:
-            quizzes: Dict[str, Dict[str, Any]] = json.loads(f.read())
+        quizzes: Dict[str, Dict[str, Any]] = load_json("quiz_concept_wiki.json")
     except FileNotFoundError:
         logger.error("quiz_concept_wiki.json not found. Run quiz generation first (python main.py --step quiz)")
         raise
@@ -90,89 +246,31 @@ def evaluate() -> None:
 
     for level, areas in quizzes.items():
         logger.info(f"Evaluating quizzes for {level} level")
-        
-        for area, area_data in tqdm(areas.items(), desc=f"{level}"):
-            if "quiz" not in area_data:
-                continue
-                
-            questions: List[str] = area_data["questions"]
-            quiz_lists: List[List[str]] = area_data["quiz"]
-
-            llm_evaluation_metrics: List[Dict[str, int]] = []
-
-            for question, quiz_list, wiki in zip(
-                questions, quiz_lists, wiki_information[level][area]["summary"]
-            ):
-                # skip if no quizzes were generated
-                if not quiz_list:
-                    evaluation_dict = _create_score_dict(0)
-                    llm_evaluation_metrics.append(evaluation_dict)
-                    continue
 
-                # aggregate all quizzes for this question
-                aggregated_quiz = "\n\n".join(
-                    [f"{i+1}: {quiz}" for i, quiz in enumerate(quiz_list)]
-                )
+        # only summaries are kept, the raw Wikipedia content is streamed past
+        wiki_summaries: Dict[str, List[str]] = {}
+
+        try:
+            for area, wiki_information in iter_json_items("wiki.json", level):
+                area_data = areas.get(area)
+                if area_data is None or "quiz" not in area_data:
+                    continue
+                wiki_summaries[area] = wiki_information["summary"]
+        except ijson.JSONError as e:
+            logger.error(f"Invalid JSON in wiki.json: {e}")
+            raise
 
-                prompt = EVALUATION_PROMPT.format(
-                    area, level, question, wiki, aggregated_quiz
+        # streaming can't fail on a missing key, so report gaps explicitly
+        for area, area_data in areas.items():
+            if "quiz" in area_data and area not in wiki_summaries:
+                logger.warning(
+                    f"No Wikipedia summaries for {level} / {area} in wiki.json, "
+                    "skipping its evaluation"
                 )
 
-                try:
-                    def evaluate_quiz() -> Dict[str, int]:
-                        """
-                        Inner function for retry logic.
-                        
-                        Calls LLM to evaluate quiz and extracts scores.
-                        Pattern matches: ```json\n{content}\n```
-                        
-                        Returns:
-                            Dictionary with evaluation scores
-                            
-                        Raises:
-                            ValueError: If no JSON found in response
-                            json.JSONDecodeError: If JSON is malformed
-                        """
-                        response = LLM.chat(
-                            messages=[ChatMessage(role="user", content=prompt)]
-                        )
-                        
-                        response_content = response.message.content
-                        
-                        if not response_content:
-                            raise ValueError("Empty response from LLM")
-                        
-                        # extract JSON block from markdown-formatted LLM response
-                        # pattern matches: ```json\n{content}\n```
-                        match = re.search(
-                            r"```json\n(.*?)\n```", response_content, re.DOTALL
-                        )
-                        
-                        if not match:
-                            raise ValueError("No JSON found in response")
-                        
-                        json_data = match.group(1)
-                        scores = json.loads(json_data)
-                        
-                        return {dim: scores[dim] for dim in EVALUATION_DIMENSIONS}
-                    
-                    evaluation_dict = retry_with_backoff(
-                        evaluate_quiz,
-                        max_retries=MAX_RETRIES,
-                        base_delay=RETRY_BASE_DELAY
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Failed to evaluate quiz after {MAX_RETRIES} attempts: {e}")
-                    # assign error marker (-1) for all dimensions
-                    evaluation_dict = _create_score_dict(-1)
-
-                llm_evaluation_metrics.append(evaluation_dict)
-
-            area_data["llm_score"] = llm_evaluation_metrics
+        run_async(_evaluate_level(level, areas, wiki_summaries))
 
     logger.info(f"Writing evaluation results to wiki_evaluation.json")
-    with open("wiki_evaluation.json", "w") as f:
-        f.write(json.dumps(quizzes, indent=4))
+    dump_json_streaming("wiki_evaluation.json", quizzes)
     
     logger.info("Evaluation completed successfully")
@@ -6,39 +6,206 @@ extracted concepts. Each quiz contains a question and four options,
 with the correct answer always in position A.
 """
 
-import json
-import os
-import time
-from typing import Any, Dict, List
+import asyncio
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
-from llama_index.core import Settings, StorageContext, VectorStoreIndex, load_index_from_storage
 from llama_index.core.llms import ChatMessage
-from llama_index.core.schema import Document
 from tqdm import tqdm
-from wikipediaapi import Wikipedia
 
-from config import (CACHE_DIR, CHUNK_OVERLAP, CHUNK_SIZE, EMBED_MODEL, INDEX_DIR, LLM,
-                    LOG_FILE, RETRIEVAL_TOP_K, WIKIPEDIA_DELAY,
-                    WIKIPEDIA_USER_AGENT)
-from prompts import QUESTION_GENERATION_PROMPT, SUMMARY_GENERATION_PROMPT
+from config import (BATCH_BINS, CACHE_DIR, CHUNK_OVERLAP, CHUNK_SIZE, EMBED_MODEL,
+                    LLM_QUIZ, LOG_FILE, OLLAMA_NUM_PARALLEL, RETRIEVAL_TOP_K,
+                    WIKIPEDIA_CONCURRENCY, WIKIPEDIA_RATE_LIMIT, WIKIPEDIA_USER_AGENT)
+from prompts import question_prompt, summary_prompt
 from utils.cache import WikipediaCache
+from utils.chunking import chunk_text
+from utils.concurrency import gather_binned, run_async, spawn
+from utils.io import dump_json_streaming, load_json
 from utils.logger import setup_logger
+from utils.retrieval import ChunkRetriever
 from utils.validation import validate_quiz_format
+from utils.wikipedia import AsyncWikipediaClient
 
 logger = setup_logger(__name__, log_file=LOG_FILE)
 
+# a quiz section runs from its "Quiz" line up to the next [Quiz] marker;
+# the first section may also appear before any marker
+_QUIZ_SECTION_RE = re.compile(r"(?:^|\[Quiz\])\s*(Quiz.*?)(?=\[Quiz\]|\Z)", re.DOTALL)
+
+
+async def _generate_summary_and_quiz(
+    level: str, area: str, question: str, wiki_information: str
+) -> Tuple[str, List[str]]:
+    """
+    Generate a summary and quizzes for a single question.
+    
+    The quiz prompt depends on the summary, so the two calls are
+    sequential; concurrency comes from running questions in parallel.
+    
+    Args:
+        level: Education level of the question
+        area: Subject area of the question
+        question: Seed question
+        wiki_information: Retrieved Wikipedia content for the question
+        
+    Returns:
+        Tuple of (summary, list of valid quizzes)
+    """
+    # generate summary from Wikipedia content
+    prompt = summary_prompt(area, level, wiki_information, question)
+
+    response = await LLM_QUIZ.achat(
+        messages=[
+            ChatMessage(role="user", content=prompt),
+        ]
+    )
+
+    summary = response.message.content
+
+    # generate quiz questions based on summary
+    prompt = question_prompt(area, level, summary, question)
+
+    response = await LLM_QUIZ.achat(
+        messages=[
+            ChatMessage(role="user", content=prompt),
+        ]
+    )
+
+    # parse quiz sections from LLM response
+    content = response.message.content
+    quiz: List[str] = []
+    for match in _QUIZ_SECTION_RE.finditer(content):
+        section = match.group(1).strip()
+        if validate_quiz_format(section):
+            quiz.append(section)
+        else:
+            logger.warning("Invalid quiz format, skipping")
+
+    return summary, quiz
+
+
+async def _fetch_wiki_page(
+    concept: str, wiki_client: AsyncWikipediaClient
+) -> Optional[Tuple[str, str]]:
+    """
+    Fetch a Wikipedia page, respecting the client's rate limit.
+    
+    Args:
+        concept: Wikipedia concept/page name
+        wiki_client: Shared async Wikipedia client
+        
+    Returns:
+        Tuple of (page_id, page_content), or None if the page could not be loaded
+    """
+    try:
+        logger.debug(f"Fetching Wikipedia page: {concept}")
+        return await wiki_client.page(concept)
+    except Exception as e:
+        logger.warning(f"Could not load Wikipedia page for '{concept}': {e}")
+        return None
+
+
+async def _prefetch_wiki_pages(
+    concepts: Iterable[str],
+    wiki_client: AsyncWikipediaClient,
+    wiki_cache: WikipediaCache,
+) -> None:
+    """
+    Fetch all uncached Wikipedia pages for a set of concepts concurrently.
+    
+    Cached pages are read off the event loop, so this can run alongside
+    another area's LLM calls.
+    
+    Args:
+        concepts: Concepts to make sure are cached
+        wiki_client: Shared async Wikipedia client
+        wiki_cache: Wikipedia page cache to fill
+    """
+    concepts = list(concepts)
+    cached = await asyncio.gather(*(wiki_cache.aget(concept) for concept in concepts))
+    missing = [concept for concept, page in zip(concepts, cached) if page is None]
+    if not missing:
+        return
+
+    # the client's connection pool and rate limit bound the fetches
+    pages = await asyncio.gather(
+        *(_fetch_wiki_page(concept, wiki_client) for concept in missing)
+    )
+
+    for concept, page in zip(missing, pages):
+        if page is not None:
+            page_id, page_content = page
+            # cache for future use
+            await wiki_cache.aset(concept, page_content, page_id)
+
+
+def _load_wiki_chunks(concepts: List[str], wiki_cache: WikipediaCache) -> List[str]:
+    """
+    Load cached Wikipedia pages for concepts as text chunks.
+    
+    Chunks are computed once per page and stored in the cache entry, so
+    later retriever builds skip tokenisation entirely.
+    
+    Args:
+        concepts: Concepts to load Wikipedia pages for
+        wiki_cache: Wikipedia page cache (filled by _prefetch_wiki_pages)
+        
+    Returns:
+        Every chunk of every page that could be loaded
+    """
+    wiki_chunks: List[str] = []
+
+    for concept in concepts:
+        chunks = wiki_cache.get_chunks(concept, CHUNK_SIZE, CHUNK_OVERLAP)
+
+        if chunks is None:
+            content = wiki_cache.get(concept)
+            if not content:
+                logger.debug(f"No Wikipedia content for concept: {concept}")
+                continue
+            chunks = chunk_text(content, CHUNK_SIZE, CHUNK_OVERLAP)
+            wiki_cache.set_chunks(concept, chunks, CHUNK_SIZE, CHUNK_OVERLAP)
+
+        wiki_chunks.extend(chunks)
+
+    return wiki_chunks
+
+
+def _build_retriever(concepts: List[str], wiki_cache: WikipediaCache) -> ChunkRetriever:
+    """
+    Build an in-memory retriever over the Wikipedia chunks of concepts.
+    
+    Args:
+        concepts: Concepts whose Wikipedia pages to retrieve from
+        wiki_cache: Wikipedia page cache (filled by _prefetch_wiki_pages)
+        
+    Returns:
+        Retriever over all chunks of the concepts' pages
+    """
+    chunks = _load_wiki_chunks(concepts, wiki_cache)
+    # chunk embeddings already seen are served from the embedding cache
+    embeddings = EMBED_MODEL.get_text_embedding_batch(chunks) if chunks else []
+    return ChunkRetriever(chunks, embeddings)
+
 
 def generate_quiz() -> None:
     """
     Generate educational quizzes based on Wikipedia content.
 
     For each question and its associated concepts:
-    1. Fetches Wikipedia pages for the concepts
-    2. Creates a semantic index for information retrieval
+    1. Fetches Wikipedia pages for the concepts (all uncached pages of an
+       area are fetched concurrently, within the Wikipedia rate limit,
+       while the previous area's summaries and quizzes are generated)
+    2. Embeds the pages' chunks for in-memory similarity search
+       (shared by questions of an area with the same concept set)
     3. Retrieves relevant content chunks for the question
     4. Generates a summary from retrieved content
     5. Creates 3 quiz questions based on the summary
 
+    Steps 4-5 run concurrently across the questions of an area; areas
+    with many questions are sent in waves of similar retrieved-context
+    length.
+
     Output files:
     - quiz_concept_wiki.json: Questions, concepts, and generated quizzes
     - wiki.json: Wikipedia summaries and raw content
@@ -48,128 +215,109 @@ def generate_quiz() -> None:
         IOError: If unable to write output files
     """
     logger.info("Initializing Wikipedia API client")
-    wiki_obj: object = Wikipedia(WIKIPEDIA_USER_AGENT, "en")
+    wiki_client = AsyncWikipediaClient(
+        WIKIPEDIA_USER_AGENT,
+        "en",
+        rate_limit=WIKIPEDIA_RATE_LIMIT,
+        concurrency=WIKIPEDIA_CONCURRENCY,
+    )
     wiki_cache = WikipediaCache(cache_dir=CACHE_DIR)
 
     logger.info("Reading concepts from concepts.json")
-    with open("concepts.json", "r") as f:
-        data: Dict[str, Dict[str, Any]] = json.loads(f.read())
-
-    # configure llama-index settings for vector indexing
-    Settings.llm = LLM
-    Settings.embed_model = EMBED_MODEL
-    Settings.chunk_size = CHUNK_SIZE
-    Settings.chunk_overlap = CHUNK_OVERLAP
+    data: Dict[str, Dict[str, Any]] = load_json("concepts.json")
 
     wiki: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
 
     for level, areas in data.items():
         wiki[level] = {}
-        logger.info(f"Generating quizzes for {level} level")
-
-        for area, question_data in tqdm(areas.items(), desc=f"{level}"):
+        for area in areas:
             wiki[level][area] = {"summary": [], "wiki": []}
             data[level][area]["quiz"] = []
 
-            for question, concepts in zip(
-                question_data["questions"], question_data["concepts"]
+    # every (level, area) in turn; the next area's pages are fetched while
+    # the current area's summaries and quizzes are generated
+    work: List[Tuple[str, str]] = [
+        (level, area) for level, areas in data.items() for area in areas
+    ]
+
+    def _start_prefetch(index: int) -> "asyncio.Task[None]":
+        level, area = work[index]
+        area_concepts = {
+            concept
+            for concepts in data[level][area]["concepts"]
+            for concept in concepts
+        }
+        return spawn(_prefetch_wiki_pages(area_concepts, wiki_client, wiki_cache))
+
+    prefetch: Optional["asyncio.Task[None]"] = _start_prefetch(0) if work else None
+
+    # one pooled session serves every page fetch of the run
+    try:
+        for index, (level, area) in enumerate(tqdm(work, desc="quiz")):
+            if index == 0 or work[index - 1][0] != level:
+                logger.info(f"Generating quizzes for {level} level")
+
+            question_data = data[level][area]
+            wiki_informations: List[str] = []
+
+            # wait for this area's pages, then start fetching the next area's
+            run_async(prefetch)
+            prefetch = _start_prefetch(index + 1) if index + 1 < len(work) else None
+
+            # retrievers are only reused within an area, so memory stays
+            # bounded by one area's concept sets
+            retriever_cache: Dict[FrozenSet[str], ChunkRetriever] = {}
+
+            questions: List[str] = question_data["questions"]
+            # every question of the area is embedded in one request
+            query_embeddings = EMBED_MODEL.get_query_embeddings(questions)
+
+            for concepts, query_embedding in zip(
+                question_data["concepts"], query_embeddings
             ):
-                wiki_docs: List[Document] = []
-
-                # fetch Wikipedia pages for each concept (with caching)
-                for concept in concepts:
-                    # try cache first
-                    cached_content = wiki_cache.get(concept)
-
-                    if cached_content:
-                        # use cached content
-                        doc = Document(text=cached_content)
-                        wiki_docs.append(doc)
-                        logger.debug(f"Using cached Wikipedia page: {concept}")
-                    else:
-                        # fetch from API with rate limiting
-                        try:
-                            logger.debug(f"Fetching Wikipedia page: {concept}")
-                            time.sleep(WIKIPEDIA_DELAY)  # rate limiting
-
-                            page_py = wiki_obj.page(concept)
-                            page_content = page_py.text
-                            page_id = str(page_py.pageid)
-
-                            # cache for future use
-                            wiki_cache.set(concept, page_content, page_id)
-
-                            doc = Document(id_=page_id, text=page_content)
-                            wiki_docs.append(doc)
-                        except Exception as e:
-                            logger.warning(
-                                f"Could not load Wikipedia page for '{concept}': {e}"
-                            )
-                            continue
-
-                if os.path.exists(INDEX_DIR):
-                    storage = StorageContext.from_defaults(persist_dir=INDEX_DIR)
-                    index = load_index_from_storage(storage_context=storage) 
-                else: 
-                    index = VectorStoreIndex.from_documents(wiki_docs)
-                    index.storage_context.persist(persist_dir=INDEX_DIR)
-
-                retriever = index.as_retriever(similarity_top_k=RETRIEVAL_TOP_K)
-                nodes = retriever.retrieve(question)
-
-                # concatenate retrieved content chunks
-                wiki_information = ""
-                for i, node in enumerate(nodes):
-                    wiki_information += f"\n\nInformation {i+1}:\n"
-                    wiki_information += node.node.get_content()
+                # questions with the same concept set share one retriever
+                concept_key = frozenset(concepts)
+                retriever = retriever_cache.get(concept_key)
+                if retriever is None:
+                    retriever = _build_retriever(concepts, wiki_cache)
+                    retriever_cache[concept_key] = retriever
 
-                wiki_information = wiki_information.strip()
+                chunks = retriever.retrieve(query_embedding, RETRIEVAL_TOP_K)
 
-                # generate summary from Wikipedia content
-                prompt = SUMMARY_GENERATION_PROMPT.format(
-                    area, level, wiki_information, question
-                )
-
-                response = LLM.chat(
-                    messages=[
-                        ChatMessage(role="user", content=prompt),
-                    ]
-                )
-
-                summary = response.message.content
-
-                # generate quiz questions based on summary
-                prompt = QUESTION_GENERATION_PROMPT.format(
-                    area, level, level, summary, question
-                )
-
-                response = LLM.chat(
-                    messages=[
-                        ChatMessage(role="user", content=prompt),
-                    ]
+                # concatenate retrieved content chunks
+                wiki_information = "\n\n".join(
+                    f"Information {i+1}:\n{chunk}" for i, chunk in enumerate(chunks)
+                ).strip()
+                wiki_informations.append(wiki_information)
+
+            # summaries and quizzes for all questions in the area run
+            # concurrently, binned by retrieved-context length only when
+            # there are enough questions to fill every wave
+            results = run_async(
+                gather_binned(
+                    wiki_informations,
+                    lambda i: _generate_summary_and_quiz(
+                        level, area, questions[i], wiki_informations[i]
+                    ),
+                    limit=OLLAMA_NUM_PARALLEL,
+                    n_bins=BATCH_BINS,
                 )
+            )
 
-                # parse quiz sections from LLM response
-                content = response.message.content
-                quiz: List[str] = []
-                for section in content.split("[Quiz]"):
-                    section = section.strip()
-                    if section and section.startswith("Quiz"):
-                        if validate_quiz_format(section):
-                            quiz.append(section)
-                        else:
-                            logger.warning("Invalid quiz format, skipping")
-
+            for (summary, quiz), wiki_information in zip(results, wiki_informations):
                 data[level][area]["quiz"].append(quiz)
                 wiki[level][area]["summary"].append(summary)
                 wiki[level][area]["wiki"].append(wiki_information)
+    finally:
+        if prefetch is not None and not prefetch.done():
+            prefetch.cancel()
+            run_async(asyncio.gather(prefetch, return_exceptions=True))
+        run_async(wiki_client.close())
 
     logger.info("Writing quizzes to quiz_concept_wiki.json")
-    with open("quiz_concept_wiki.json", "w") as f:
-        f.write(json.dumps(data, indent=4))
+    dump_json_streaming("quiz_concept_wiki.json", data)
 
     logger.info("Writing Wikipedia content to wiki.json")
-    with open("wiki.json", "w") as f:
-        f.write(json.dumps(wiki, indent=4))
+    dump_json_streaming("wiki.json", wiki)
 
     logger.info("Quiz generation completed successfully")
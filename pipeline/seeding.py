@@ -6,14 +6,21 @@ using an LLM. Questions are designed to be diverse and appropriate for the
 specified education level.
 """
 
+import asyncio
 import json
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from llama_index.core.llms import ChatMessage
-from prompts import SEED_QUESTION_GENERATION_PROMPT
+from prompts import seed_question_prompt
 from tqdm import tqdm
-from config import LLM, EDUCATION_LEVELS, LOG_FILE
+from config import (LLM, EDUCATION_LEVELS, EMBED_MODEL, EMBEDDING_MODEL,
+                    LLM_CACHE_DIR, LOG_FILE, OLLAMA_NUM_PARALLEL,
+                    SEMANTIC_CACHE_DIR, SEMANTIC_THRESHOLD)
+from utils.concurrency import run_async
+from utils.io import dump_json_streaming
+from utils.llm_cache import LLMResponseCache
 from utils.logger import setup_logger
+from utils.semantic_cache import SemanticCache
 from utils.validation import sanitise_area_name, validate_questions
 
 logger = setup_logger(__name__, log_file=LOG_FILE)
@@ -30,42 +37,158 @@ class QuestionModel(BaseModel):
 # attach pydantic class to ensure structured outputs
 seed_llm = LLM.as_structured_llm(QuestionModel)
 
-def seed_questions() -> None:
+async def _seed_area(
+    level: str,
+    area: str,
+    semaphore: asyncio.Semaphore,
+    llm_cache: LLMResponseCache,
+) -> Tuple[str, str, List[str]]:
+    """
+    Generate seed questions for one area at one education level.
+    
+    Raw completions are cached, so re-runs with the same prompt, model,
+    and temperature skip the LLM call.
+    
+    Args:
+        level: Education level
+        area: Sanitised subject area
+        semaphore: Limits concurrent LLM requests across all areas
+        llm_cache: Cache of raw seed completions
+        
+    Returns:
+        Tuple of (level, area, validated questions)
+    """
+    prompt = seed_question_prompt(area, level)
+    cache_key = llm_cache.make_key(LLM.model, LLM.temperature, prompt)
+    content = llm_cache.get(cache_key)
+
+    if content is None:
+        # generate seed questions
+        async with semaphore:
+            json_str = await seed_llm.achat(
+                messages=[ChatMessage(role="user", content=prompt)]
+            )
+        content = str(json_str.message.content)
+        json_obj = json.loads(content)
+        # only cache completions that parse
+        llm_cache.set(cache_key, content)
+    else:
+        json_obj = json.loads(content)
+
+    questions = [q.strip() for q in json_obj['questions'] if q.strip()]
+    questions = validate_questions(questions, min_count=3)
+    return level, area, questions
+
+
+def _dedupe_areas(areas: List[str]) -> Dict[str, str]:
+    """
+    Map each area to a canonical area with the same meaning.
+    
+    Only runs if SEMANTIC_THRESHOLD is set; otherwise every area is its
+    own canonical area and nothing is embedded. Area names are embedded
+    (through the embedding cache) and looked up in a persistent semantic
+    cache, so stylistic variants such as "ml" and "machine learning" map
+    to one of them. Matches are only accepted against areas in `areas`,
+    so every prompt is for an area in the input.
+    
+    Args:
+        areas: Sanitised area names
+        
+    Returns:
+        Mapping of area to canonical area
+    """
+    if SEMANTIC_THRESHOLD is None:
+        return {area: area for area in areas}
+
+    semantic_cache = SemanticCache(
+        EMBEDDING_MODEL, cache_dir=SEMANTIC_CACHE_DIR, threshold=SEMANTIC_THRESHOLD
+    )
+    inputs = set(areas)
+    vectors = EMBED_MODEL.get_text_embedding_batch(areas)
+    canonical: Dict[str, str] = {}
+
+    for area, vector in zip(areas, vectors):
+        if area in canonical:
+            continue
+        match = semantic_cache.get(vector)
+        if match is None or match not in inputs:
+            semantic_cache.set(area, vector)
+            match = area
+        elif match != area:
+            logger.warning(f"Reusing seed questions of '{match}' for '{area}'")
+        canonical[area] = match
+
+    semantic_cache.save()
+    return canonical
+
+
+async def _seed_all(
+    canonical: Dict[str, str],
+    out: Dict[str, Dict[str, List[str]]],
+    max_concurrency: int,
+) -> None:
+    """
+    Generate seed questions for every (level, canonical area) pair concurrently.
+    
+    Args:
+        canonical: Mapping of area to canonical area, in areas.txt order
+        out: Output mapping of level to area to questions (updated in place)
+        max_concurrency: Maximum number of in-flight LLM requests
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    llm_cache = LLMResponseCache(cache_dir=LLM_CACHE_DIR)
+    # areas served by each canonical area's completion
+    variants: Dict[str, List[str]] = {}
+    for area, target in canonical.items():
+        variants.setdefault(target, []).append(area)
+
+    tasks = []
+    for level in EDUCATION_LEVELS:
+        # reserve the slots so output keeps areas.txt order
+        out[level] = {area: [] for area in canonical}
+        for target in variants:
+            tasks.append(_seed_area(level, target, semaphore, llm_cache))
+
+    for next_done in tqdm(
+        asyncio.as_completed(tasks), total=len(tasks), desc="seeding"
+    ):
+        level, target, questions = await next_done
+        for area in variants[target]:
+            out[level][area] = questions
+
+
+def seed_questions(max_concurrency: int = OLLAMA_NUM_PARALLEL) -> None:
     """
     Generate seed questions for different education levels and subject areas.
     
     Reads subject areas from areas.txt and uses an LLM to generate 5 diverse
     questions for each area at primary school, high school, and PhD levels.
+    Near-duplicate area names share one set of questions. All remaining
+    (level, area) requests are issued concurrently.
     Output is saved to questions.json.
     
+    Args:
+        max_concurrency: Maximum number of in-flight LLM requests
+    
     Raises:
         FileNotFoundError: If areas.txt doesn't exist
         IOError: If unable to write questions.json
     """
     logger.info("Reading subject areas from areas.txt")
+    # sanitise once per area rather than once per (level, area)
     with open("areas.txt", "r") as f:
-        areas: List[str] = f.read().splitlines()
+        areas: List[str] = [sanitise_area_name(line) for line in f if line.strip()]
 
+    canonical = _dedupe_areas(areas)
     out: Dict[str, Dict[str, List[str]]] = {}
 
-    for level in EDUCATION_LEVELS:
-        out[level] = {}
-        logger.info(f"Generating questions for {level} level")
-
-        for area in tqdm(areas, desc=f"{level}"):
-            area = sanitise_area_name(area)
-            prompt = SEED_QUESTION_GENERATION_PROMPT.format(area, level)
-
-            # generate seed questions
-            json_str = seed_llm.chat(messages=[ChatMessage(role="user", content=prompt)])
-            json_obj = json.loads(str(json_str.message.content))
-
-            questions = [q.strip() for q in json_obj['questions'] if q.strip()]
-            questions = validate_questions(questions, min_count=3)
-            out[level][area] = questions
+    logger.info(
+        f"Generating questions for {len(set(canonical.values()))} distinct areas "
+        f"at {len(EDUCATION_LEVELS)} levels ({max_concurrency} concurrent requests)"
+    )
+    run_async(_seed_all(canonical, out, max_concurrency))
 
     logger.info("Writing questions to questions.json")
-    with open("questions.json", "w") as f:
-        f.write(json.dumps(out, indent=4))
+    dump_json_streaming("questions.json", out)
     
     logger.info(f"Successfully generated questions for {len(areas)} areas across {len(EDUCATION_LEVELS)} levels")
@@ -1,3 +1,5 @@
+from typing import Tuple
+
 SEED_QUESTION_GENERATION_PROMPT = """You are a curious student at a specified education level and are learning about a particular area of study. Your goal is to generate 5 diverse questions you would want to ask while learning about this subject. Directly output the questions in the format below without bullet points. The questions should reflect knowledge that cannot be easily found by large language models and require expertise in the field. Additionally, the questions should be appropriate for the student's education level and should not involve concepts that are too advanced.
 
 Here is an example:
@@ -29,14 +31,17 @@ Area: {}
 Concept:"""
 
 
-SUMMARY_GENERATION_PROMPT = """You are a summary generator. The students are currently studying {} at the {} level and have asked a question. You have access to reference information from Wikipedia. Your task is to condense this information into a single, clear paragraph that highlights the key points and aids the students in better understanding their question.
+SUMMARY_GENERATION_PROMPT = """You are a summary generator. The students are currently studying the area below at the given education level and have asked a question. You have access to reference information from Wikipedia. Your task is to condense this information into a single, clear paragraph that highlights the key points and aids the students in better understanding their question.
+
+Area: {}
+Education level: {}
 
 Reference Wikipedia Information:
 {}
 
 Student Question: {}"""
 
-QUESTION_GENERATION_PROMPT = """You are a quiz generator. The students are currently studying {} at the {} level and have asked a question. Your task is to create 3 quizzes that helps the student better understand the question. You have access to summarized reference information from Wikipedia. The quizzes should accurately reflect reference information, and the correct answer must be well-supported by reference information. The quiz should consist of one question, one correct answer, and three incorrect options. The correct answer must always be placed in option A. The difficulty level should align with the knowledge and reasoning complexity appropriate for {} education.
+QUESTION_GENERATION_PROMPT = """You are a quiz generator. The students are currently studying the area below at the given education level and have asked a question. Your task is to create 3 quizzes that helps the student better understand the question. You have access to summarized reference information from Wikipedia. The quizzes should accurately reflect reference information, and the correct answer must be well-supported by reference information. The quiz should consist of one question, one correct answer, and three incorrect options. The correct answer must always be placed in option A. The difficulty level should align with the knowledge and reasoning complexity appropriate for the students' education level.
 
 Example:
 
@@ -56,12 +61,14 @@ C. Africa
 D. North America
 
 Now, please generate 3 quizzes following the format, each quiz should follow thw sign of [Quiz]:
+Area: {}
+Education level: {}
 Reference Wikipedia Information:
 {}
 
 Student Question: {}"""
 
-EVALUATION_PROMPT = """A student studying {} at the {} level is asking a question: "{}". A quiz set has been created to help the student gain a better understanding of this topic, with the correct answer always being option A. Please evaluate the quality of this quiz set based on the following criteria, assigning a score from 1 to 5 for the entire set. You should give evaluation based on whether the quiz should accurately reflect reference information from Wikipedia, and the correct answer must be well-supported by reference information.  Be strict in your assessment and give low scores to quizzes that do not reflect reference information, as the correctness cannot be verified without a reliable source.
+EVALUATION_PROMPT = """A student studying an area at a given education level is asking a question. A quiz set has been created to help the student gain a better understanding of this topic, with the correct answer always being option A. Please evaluate the quality of this quiz set based on the following criteria, assigning a score from 1 to 5 for the entire set. You should give evaluation based on whether the quiz should accurately reflect reference information from Wikipedia, and the correct answer must be well-supported by reference information.  Be strict in your assessment and give low scores to quizzes that do not reflect reference information, as the correctness cannot be verified without a reliable source.
 
 1. Educational Value: Do you think these quizzes are educational? Will students learn more by taking these quizzes?
     - 1: Not educational at all, no learning value.
@@ -98,14 +105,18 @@ EVALUATION_PROMPT = """A student studying {} at the {} level is asking a questio
     - 4: Quite comprehensive, addresses most key aspects with reasonable depth.
     - 5: Highly comprehensive, thoroughly covers the topic in great depth and detail.
 
+Here is the student's area, education level, and question:
+Area: {}
+Education level: {}
+Question: "{}"
+
 Here is reference information from Wikipedia:
 {}
 
 Here is the quiz set related to the question:
 {}
 
-Please start by providing a step-by-step reasoning analysis of the quiz set, then return your evaluation as a JSON object in the following format:
-```json
+Return only your evaluation as a JSON object, with an integer score from 1 to 5 for each dimension and no other text:
 {{
 "Educational Value": score,
 "Diversity": score,
@@ -113,5 +124,70 @@ Please start by providing a step-by-step reasoning analysis of the quiz set, the
 "Difficulty Appropriateness": score,
 "Comprehensiveness": score
 }}
-```
 """
+
+
+def _split_template(template: str) -> Tuple[str, ...]:
+    """
+    Split a positional-placeholder template into its literal pieces.
+    
+    Escaped braces are unescaped so pieces can be concatenated directly.
+    
+    Args:
+        template: Template using "{}" placeholders
+        
+    Returns:
+        Literal text around each placeholder (one more than placeholders)
+    """
+    return tuple(
+        part.replace("{{", "{").replace("}}", "}") for part in template.split("{}")
+    )
+
+
+# templates are split once at import so prompt assembly is plain concatenation
+# instead of re-parsing the format string on every call; every placeholder
+# sits after the static instructions and examples, so consecutive prompts
+# share a long identical prefix that Ollama can reuse from its KV cache
+_SEED_PARTS = _split_template(SEED_QUESTION_GENERATION_PROMPT)
+_CONCEPT_PARTS = _split_template(CONCEPT_GENERATION_PROMPT)
+_SUMMARY_PARTS = _split_template(SUMMARY_GENERATION_PROMPT)
+_QUESTION_PARTS = _split_template(QUESTION_GENERATION_PROMPT)
+_EVALUATION_PARTS = _split_template(EVALUATION_PROMPT)
+
+
+def seed_question_prompt(area: str, level: str) -> str:
+    """Build SEED_QUESTION_GENERATION_PROMPT for an area and level."""
+    p = _SEED_PARTS
+    return p[0] + area + p[1] + level + p[2]
+
+
+def concept_prompt(question: str, level: str, area: str) -> str:
+    """Build CONCEPT_GENERATION_PROMPT for a question."""
+    p = _CONCEPT_PARTS
+    return p[0] + question + p[1] + level + p[2] + area + p[3]
+
+
+def summary_prompt(area: str, level: str, wiki_information: str, question: str) -> str:
+    """Build SUMMARY_GENERATION_PROMPT for a question and its Wikipedia context."""
+    p = _SUMMARY_PARTS
+    return (
+        p[0] + area + p[1] + level + p[2] + wiki_information + p[3]
+        + question + p[4]
+    )
+
+
+def question_prompt(area: str, level: str, summary: str, question: str) -> str:
+    """Build QUESTION_GENERATION_PROMPT for a question and its summary."""
+    p = _QUESTION_PARTS
+    return p[0] + area + p[1] + level + p[2] + summary + p[3] + question + p[4]
+
+
+def evaluation_prompt(
+    area: str, level: str, question: str, wiki: str, aggregated_quiz: str
+) -> str:
+    """Build EVALUATION_PROMPT for a question's quiz set."""
+    p = _EVALUATION_PARTS
+    return (
+        p[0] + area + p[1] + level + p[2] + question + p[3]
+        + wiki + p[4] + aggregated_quiz + p[5]
+    )
@@ -5,41 +5,102 @@ Provides disk-based caching for Wikipedia pages to reduce API calls
 and improve performance during development and re-runs.
 """
 
-import json
+import asyncio
 import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Dict, Iterator, List, Optional
+
+import orjson
 
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# marks a cache directory whose filenames are BLAKE2b (not MD5) hashes
+_HASH_MARKER = ".blake2b"
+
+# threads used to unlink files in clear()
+_CLEAR_WORKERS = 8
+
+# hex digits of the hash used to name each cache file's shard directory
+_SHARD_CHARS = 2
+
+
+@lru_cache(maxsize=4096)
+def _hash(concept: str) -> str:
+    """
+    Hash concept name for a safe cache filename.
+    
+    Memoised, since the same concepts are looked up many times per stage.
+    
+    Args:
+        concept: Wikipedia concept/page name
+        
+    Returns:
+        Hex BLAKE2b-128 digest of the concept name
+    """
+    return hashlib.blake2b(concept.encode(), digest_size=16).hexdigest()
+
+
+def _unlink(cache_file: Path) -> bool:
+    """
+    Delete a cache file, logging failures.
+    
+    Args:
+        cache_file: Path to cache file
+        
+    Returns:
+        True if the file was deleted, False otherwise
+    """
+    try:
+        os.unlink(cache_file)
+        return True
+    except Exception as e:
+        logger.warning(f"Error deleting cache file {cache_file}: {e}")
+        return False
+
 
 class WikipediaCache:
     """
     Disk-based cache for Wikipedia pages.
     
-    Caches page content by concept name using JSON files.
+    Caches page content by concept name using JSON files (orjson), with an
+    in-memory LRU layer so repeated lookups skip disk I/O and JSON decoding.
+    Entries can also store the page's text chunks, with the chunking
+    parameters they were computed with.
     Never expires - manual clearing only via clear() method.
     """
     
-    def __init__(self, cache_dir: str = ".cache/wikipedia"):
+    def __init__(self, cache_dir: str = ".cache/wikipedia", memory_size: int = 256):
         """
         Initialise cache.
         
         Args:
             cache_dir: Directory to store cache files
+            memory_size: Maximum number of pages kept in memory
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        if not (self.cache_dir / _HASH_MARKER).exists():
+            self._migrate_md5_to_blake2b()
+        # cache files by hash, so lookups never stat the filesystem
+        self._index: Dict[str, Path] = self._build_index()
         logger.debug(f"Wikipedia cache initialized at {self.cache_dir}")
     
     def _get_cache_path(self, concept: str) -> Path:
         """
         Get cache file path for concept.
         
-        Uses MD5 hash of concept name to avoid filesystem issues
-        with special characters.
+        Uses BLAKE2b-128 hash of concept name to avoid filesystem issues
+        with special characters. Files are sharded into subdirectories
+        named after the hash's first two hex digits, so no directory grows
+        past a few thousand entries.
         
         Args:
             concept: Wikipedia concept/page name
@@ -47,33 +108,225 @@ class WikipediaCache:
         Returns:
             Path to cache file
         """
-        # hash concept name for safe filename
-        concept_hash = hashlib.md5(concept.encode()).hexdigest()
-        return self.cache_dir / f"{concept_hash}.json"
+        concept_hash = _hash(concept)
+        return self.cache_dir / concept_hash[:_SHARD_CHARS] / f"{concept_hash}.json"
     
-    def get(self, concept: str) -> Optional[str]:
+    def _scan(self) -> Iterator[os.DirEntry]:
         """
-        Get cached page content for concept.
+        Scan cache files in both the flat and the sharded layout.
+        
+        Flat files (written before sharding) are yielded before sharded
+        ones, so a later sharded copy of the same entry takes precedence.
+        
+        Yields:
+            Directory entry of each cache file
+        """
+        shards: List[str] = []
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield entry
+                elif len(entry.name) == _SHARD_CHARS and entry.is_dir():
+                    shards.append(entry.path)
+        
+        for shard in shards:
+            with os.scandir(shard) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        yield entry
+    
+    def _build_index(self) -> Dict[str, Path]:
+        """
+        Index existing cache files with a single scan of each directory.
+        
+        Where an entry has both a flat and a sharded file, the flat copy is
+        deleted, so each entry has exactly one file.
+        
+        Returns:
+            Mapping of concept hash to cache file path
+        """
+        index: Dict[str, Path] = {}
+        for entry in self._scan():
+            concept_hash = entry.name[:-5]
+            # flat files are scanned first, so a duplicate is the flat copy
+            if concept_hash in index:
+                _unlink(index[concept_hash])
+            index[concept_hash] = Path(entry.path)
+        return index
+    
+    def _migrate_md5_to_blake2b(self) -> None:
+        """
+        Rename cache files written under MD5 filenames to BLAKE2b filenames.
+        
+        Each file's stored concept is rehashed, so existing caches stay
+        valid. Runs once per cache directory; a marker file records that
+        the directory uses BLAKE2b names.
+        """
+        migrated = 0
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                concept = orjson.loads(cache_file.read_bytes())["concept"]
+                new_path = self._get_cache_path(concept)
+                if new_path == cache_file:
+                    continue
+                if new_path.exists():
+                    cache_file.unlink()
+                else:
+                    new_path.parent.mkdir(exist_ok=True)
+                    cache_file.rename(new_path)
+                migrated += 1
+            except Exception as e:
+                logger.warning(f"Error migrating cache file {cache_file}: {e}")
+        
+        (self.cache_dir / _HASH_MARKER).write_text("blake2b\n")
+        if migrated:
+            logger.info(f"Migrated {migrated} cached Wikipedia pages to BLAKE2b filenames")
+    
+    def _remember(self, concept: str, data: Dict[str, Any]) -> None:
+        """
+        Store a cache entry in the in-memory LRU layer.
         
         Args:
             concept: Wikipedia concept/page name
+            data: Cache entry (page content and optional chunks)
+        """
+        self._memory[concept] = data
+        self._memory.move_to_end(concept)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+    
+    def _read_file(self, concept: str, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Read and decode a cache file.
+        
+        Touches no shared state, so it is safe to run in a worker thread.
+        
+        Args:
+            concept: Wikipedia concept/page name
+            cache_path: Path to the concept's cache file
             
         Returns:
-            Cached page content if exists, None otherwise
+            Cache entry, or None if the file could not be read
         """
-        cache_path = self._get_cache_path(concept)
-        
-        if not cache_path.exists():
+        try:
+            data = orjson.loads(cache_path.read_bytes())
+            logger.debug(f"Cache hit for concept: {concept}")
+            return data
+        except Exception as e:
+            logger.warning(f"Error reading cache for '{concept}': {e}")
             return None
+    
+    def _write_file(self, concept: str, cache_path: Path, data: Dict[str, Any]) -> bool:
+        """
+        Encode and write a cache file.
         
+        Touches no shared state, so it is safe to run in a worker thread.
+        
+        Args:
+            concept: Wikipedia concept/page name
+            cache_path: Path to the concept's cache file
+            data: Cache entry to store
+            
+        Returns:
+            True if the file was written, False otherwise
+        """
         try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                logger.debug(f"Cache hit for concept: {concept}")
-                return data["content"]
+            cache_path.parent.mkdir(exist_ok=True)
+            # cache files are machine-read, so written compact in one call
+            cache_path.write_bytes(orjson.dumps(data))
+            logger.debug(f"Cached concept: {concept}")
+            return True
         except Exception as e:
-            logger.warning(f"Error reading cache for '{concept}': {e}")
+            logger.warning(f"Error caching '{concept}': {e}")
+            return False
+    
+    def _update_index(self, cache_path: Path) -> None:
+        """
+        Point the index at a newly written cache file.
+        
+        A flat-layout copy of the same entry is deleted, so each entry has
+        exactly one file.
+        
+        Args:
+            cache_path: Path of the cache file just written
+        """
+        old_path = self._index.get(cache_path.stem)
+        if old_path is not None and old_path != cache_path:
+            _unlink(old_path)
+        self._index[cache_path.stem] = cache_path
+    
+    def _get_entry(self, concept: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cache entry for concept from memory or disk.
+        
+        Args:
+            concept: Wikipedia concept/page name
+            
+        Returns:
+            Cache entry if exists, None otherwise
+        """
+        if concept in self._memory:
+            self._memory.move_to_end(concept)
+            return self._memory[concept]
+        
+        cache_path = self._index.get(_hash(concept))
+        
+        if cache_path is None:
             return None
+        
+        data = self._read_file(concept, cache_path)
+        if data is not None:
+            self._remember(concept, data)
+        return data
+    
+    def _write_entry(self, concept: str, data: Dict[str, Any]) -> None:
+        """
+        Write cache entry for concept to disk and memory.
+        
+        Args:
+            concept: Wikipedia concept/page name
+            data: Cache entry to store
+        """
+        cache_path = self._get_cache_path(concept)
+        
+        if self._write_file(concept, cache_path, data):
+            self._update_index(cache_path)
+        
+        # keep memory layer in sync with disk
+        self._remember(concept, data)
+    
+    def get(self, concept: str) -> Optional[str]:
+        """
+        Get cached page content for concept.
+        
+        Args:
+            concept: Wikipedia concept/page name
+            
+        Returns:
+            Cached page content if exists, None otherwise
+        """
+        data = self._get_entry(concept)
+        return data["content"] if data is not None else None
+    
+    def get_chunks(
+        self, concept: str, chunk_size: int, chunk_overlap: int
+    ) -> Optional[List[str]]:
+        """
+        Get cached text chunks for concept.
+        
+        Args:
+            concept: Wikipedia concept/page name
+            chunk_size: Tokens per chunk the chunks must have been built with
+            chunk_overlap: Token overlap the chunks must have been built with
+            
+        Returns:
+            Cached chunks if the page is cached and was chunked with the
+            same parameters, None otherwise
+        """
+        data = self._get_entry(concept)
+        if data is None or data.get("chunk_params") != [chunk_size, chunk_overlap]:
+            return None
+        return data["chunks"]
     
     def set(self, concept: str, content: str, page_id: str) -> None:
         """
@@ -84,34 +337,109 @@ class WikipediaCache:
             content: Page content to cache
             page_id: Wikipedia page ID
         """
+        data = {
+            "concept": concept,
+            "page_id": page_id,
+            "content": content
+        }
+        self._write_entry(concept, data)
+    
+    async def aget(self, concept: str) -> Optional[str]:
+        """
+        Get cached page content for concept without blocking the event loop.
+        
+        Memory hits return immediately; disk reads and JSON decoding run in
+        a worker thread.
+        
+        Args:
+            concept: Wikipedia concept/page name
+            
+        Returns:
+            Cached page content if exists, None otherwise
+        """
+        if concept in self._memory:
+            return self.get(concept)
+        
+        cache_path = self._index.get(_hash(concept))
+        
+        if cache_path is None:
+            return None
+        
+        data = await asyncio.to_thread(self._read_file, concept, cache_path)
+        if data is None:
+            return None
+        self._remember(concept, data)
+        return data["content"]
+    
+    async def aset(self, concept: str, content: str, page_id: str) -> None:
+        """
+        Cache page content for concept without blocking the event loop.
+        
+        JSON encoding and the disk write run in a worker thread.
+        
+        Args:
+            concept: Wikipedia concept/page name
+            content: Page content to cache
+            page_id: Wikipedia page ID
+        """
+        data = {
+            "concept": concept,
+            "page_id": page_id,
+            "content": content
+        }
         cache_path = self._get_cache_path(concept)
         
-        try:
-            data = {
-                "concept": concept,
-                "page_id": page_id,
-                "content": content
-            }
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.debug(f"Cached concept: {concept}")
-        except Exception as e:
-            logger.warning(f"Error caching '{concept}': {e}")
+        if await asyncio.to_thread(self._write_file, concept, cache_path, data):
+            self._update_index(cache_path)
+        
+        # keep memory layer in sync with disk
+        self._remember(concept, data)
+    
+    def set_chunks(
+        self, concept: str, chunks: List[str], chunk_size: int, chunk_overlap: int
+    ) -> None:
+        """
+        Cache text chunks for an already cached concept.
+        
+        Args:
+            concept: Wikipedia concept/page name
+            chunks: Text chunks of the page content
+            chunk_size: Tokens per chunk
+            chunk_overlap: Token overlap between consecutive chunks
+        """
+        data = self._get_entry(concept)
+        if data is None:
+            logger.warning(f"Cannot cache chunks for uncached concept: {concept}")
+            return
+        
+        data = {
+            **data,
+            "chunk_params": [chunk_size, chunk_overlap],
+            "chunks": chunks
+        }
+        self._write_entry(concept, data)
     
     def clear(self) -> int:
         """
         Clear all cached pages.
         
+        Files are unlinked from a small thread pool, since unlink releases
+        the GIL and large caches otherwise pay one round-trip per file.
+        
         Returns:
             Number of cache files deleted
         """
+        self._memory.clear()
+        
+        indexed = list(self._index.items())
+        with ThreadPoolExecutor(max_workers=_CLEAR_WORKERS) as executor:
+            deleted = list(executor.map(_unlink, [path for _, path in indexed]))
+        
         count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                cache_file.unlink()
+        for (concept_hash, _), ok in zip(indexed, deleted):
+            if ok:
+                del self._index[concept_hash]
                 count += 1
-            except Exception as e:
-                logger.warning(f"Error deleting cache file {cache_file}: {e}")
         
         logger.info(f"Cleared {count} cached Wikipedia pages")
         return count
@@ -120,13 +448,19 @@ class WikipediaCache:
         """
         Get cache statistics.
         
+        Uses a single scan of each directory, reading sizes from the scan
+        entries.
+        
         Returns:
             Dict with cache stats (total_pages, total_size_mb)
         """
-        cache_files = list(self.cache_dir.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in cache_files)
+        total_pages = 0
+        total_size = 0
+        for entry in self._scan():
+            total_pages += 1
+            total_size += entry.stat().st_size
         
         return {
-            "total_pages": len(cache_files),
+            "total_pages": total_pages,
             "total_size_mb": round(total_size / (1024 * 1024), 2)
         }
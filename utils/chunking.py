@@ -0,0 +1,72 @@
+"""
+Token-window text chunking.
+
+Splits Wikipedia page text into overlapping chunks of a fixed number of
+cl100k_base tokens, so chunks can be computed once per page and cached
+instead of re-running llama-index's node parser on every index build.
+"""
+
+import os
+from functools import lru_cache
+from typing import List
+
+import llama_index.core
+import tiktoken
+
+# tokenizer files bundled with llama-index, so no download is needed
+_TIKTOKEN_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(llama_index.core.__file__)),
+    "_static",
+    "tiktoken_cache",
+)
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> tiktoken.Encoding:
+    """
+    Load the cl100k_base encoding once.
+
+    Returns:
+        cl100k_base tiktoken encoding
+    """
+    os.environ.setdefault("TIKTOKEN_CACHE_DIR", _TIKTOKEN_CACHE_DIR)
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def chunk_text(text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """
+    Split text into overlapping windows of tokens.
+
+    Args:
+        text: Text to split
+        chunk_size: Tokens per chunk
+        chunk_overlap: Tokens shared by consecutive chunks
+
+    Returns:
+        Non-empty text chunks in document order
+
+    Raises:
+        ValueError: If chunk_overlap is not smaller than chunk_size
+    """
+    if chunk_overlap >= chunk_size:
+        raise ValueError(
+            f"chunk_overlap ({chunk_overlap}) must be smaller than "
+            f"chunk_size ({chunk_size})"
+        )
+
+    encoding = _encoding()
+    tokens = encoding.encode_ordinary(text)
+    step = chunk_size - chunk_overlap
+
+    # token windows can split a multi-byte character, so slice the text at
+    # each window's character offsets instead of decoding the raw tokens;
+    # a split character then goes whole to the window starting inside it
+    decoded, offsets = encoding.decode_with_offsets(tokens)
+    offsets.append(len(decoded))
+    chunks = [
+        decoded[offsets[start]:offsets[min(start + chunk_size, len(tokens))]]
+        for start in range(0, max(len(tokens) - chunk_overlap, 1), step)
+        if start < len(tokens)
+    ]
+
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
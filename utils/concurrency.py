@@ -0,0 +1,150 @@
+"""
+Async concurrency helpers.
+
+Provides a shared event loop, bounded gather, and length-binned gather so
+pipeline stages can issue LLM requests concurrently without overwhelming
+the Ollama server.
+"""
+
+import asyncio
+import math
+from typing import (Any, Awaitable, Callable, Coroutine, Iterable, List, Optional,
+                    Sequence, TypeVar, Union)
+
+T = TypeVar('T')
+
+# shared loop: async clients bind to the loop they were first used on,
+# so every stage must run on the same one
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro: Union[Coroutine[Any, Any, T], "asyncio.Future[T]"]) -> T:
+    """
+    Run coroutine (or wait for task) to completion on the shared pipeline event loop.
+
+    Args:
+        coro: Coroutine to run, or task from spawn()
+
+    Returns:
+        Result of the coroutine
+    """
+    return _get_loop().run_until_complete(coro)
+
+
+def spawn(coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+    """
+    Schedule coroutine on the shared pipeline event loop without waiting.
+
+    The task makes progress whenever the loop runs, i.e. during later
+    run_async() calls; pass it to run_async() to wait for its result.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Task wrapping the coroutine
+    """
+    return _get_loop().create_task(coro)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared pipeline event loop, creating it if needed.
+
+    Returns:
+        Shared event loop
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[T]], limit: Union[int, asyncio.Semaphore]
+) -> List[T]:
+    """
+    Await all awaitables concurrently with at most `limit` in flight.
+
+    Args:
+        aws: Awaitables to run (e.g. LLM chat coroutines)
+        limit: Maximum number of concurrent awaitables, or a semaphore
+            shared with other concurrent gathers
+
+    Returns:
+        Results in the same order as the input awaitables
+    """
+    if isinstance(limit, asyncio.Semaphore):
+        semaphore = limit
+    else:
+        semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_bounded(aw) for aw in aws))
+
+
+def bin_by_length(prompts: Sequence[str], n_bins: int = 3) -> List[List[int]]:
+    """
+    Group prompt indices into bins of similar length.
+
+    Character length is used as a cheap proxy for token count. Indices
+    are sorted by length and split into `n_bins` equally sized bins
+    (terciles by default), shortest first.
+
+    Args:
+        prompts: Prompts (or prompt-dominating text) to bin
+        n_bins: Number of bins
+
+    Returns:
+        List of bins, each a list of indices into `prompts`
+    """
+    if not prompts:
+        return []
+
+    order = sorted(range(len(prompts)), key=lambda i: len(prompts[i]))
+    bin_size = math.ceil(len(order) / max(n_bins, 1))
+    return [order[i:i + bin_size] for i in range(0, len(order), bin_size)]
+
+
+async def gather_binned(
+    prompts: Sequence[str],
+    func: Callable[[int], Awaitable[T]],
+    limit: int,
+    n_bins: int = 3,
+) -> List[T]:
+    """
+    Await `func(i)` for every prompt index, one length bin at a time.
+
+    Each bin is submitted as its own concurrent wave so requests in a
+    server-side batch finish close together instead of waiting on the
+    longest prompt.
+
+    Binning only orders the requests of this one gather; concurrent
+    gathers sharing the server interleave their waves, so callers running
+    several gathers at once should use gather_bounded instead. With no
+    more than `n_bins * limit` prompts, waves would hold fewer requests
+    than the server can run, so everything goes out in one wave.
+
+    Args:
+        prompts: Prompts used to bin the requests by length
+        func: Called with a prompt index, returns the awaitable to run
+        limit: Maximum number of concurrent awaitables within a bin
+        n_bins: Number of length bins
+
+    Returns:
+        Results in the same order as `prompts`
+    """
+    if len(prompts) <= n_bins * limit:
+        return await gather_bounded((func(i) for i in range(len(prompts))), limit)
+
+    results: List[Any] = [None] * len(prompts)
+
+    for indices in bin_by_length(prompts, n_bins):
+        bin_results = await gather_bounded((func(i) for i in indices), limit)
+        for i, result in zip(indices, bin_results):
+            results[i] = result
+
+    return results
@@ -0,0 +1,200 @@
+"""
+Embedding caching system.
+
+Provides a content-addressed SQLite cache for chunk embeddings so
+repeated Wikipedia chunks skip the embedding API entirely.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# keep IN (...) queries well under SQLite's bound-parameter limit
+_QUERY_BATCH_SIZE = 500
+
+
+def _quantise(embedding: Sequence[float]) -> Tuple[float, bytes]:
+    """
+    Quantise an embedding to int8 with a per-vector scale.
+
+    Args:
+        embedding: Embedding vector
+
+    Returns:
+        Tuple of (scale, int8 vector bytes)
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    scale = float(np.max(np.abs(vector), initial=0.0)) / 127.0
+    if scale == 0.0:
+        # all-zero vector, any scale reproduces it
+        scale = 1.0
+    quantised = np.round(vector / scale).astype(np.int8)
+    return scale, quantised.tobytes()
+
+
+def _dequantise(scale: float, vector: bytes) -> List[float]:
+    """
+    Restore an embedding quantised by _quantise.
+
+    Args:
+        scale: Per-vector scale
+        vector: int8 vector bytes
+
+    Returns:
+        Approximate float embedding vector
+    """
+    quantised = np.frombuffer(vector, dtype=np.int8)
+    return (quantised.astype(np.float32) * np.float32(scale)).tolist()
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed cache for text embeddings.
+
+    Entries are keyed by SHA-256 of (model name, text) so switching the
+    embedding model never returns vectors from a different model.
+    Vectors are quantised to int8 with a per-vector float32 scale, a
+    quarter of the float32 size with negligible effect on cosine ranking.
+    Never expires - manual clearing only via clear() method.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/embeddings"):
+        """
+        Initialise cache.
+
+        The database is opened lazily on first use.
+
+        Args:
+            cache_dir: Directory to store the cache database
+        """
+        self.cache_dir = Path(cache_dir)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get the database connection, creating the database if needed.
+
+        Returns:
+            Open SQLite connection
+        """
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.cache_dir / "embeddings.db")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, scale REAL NOT NULL, vector BLOB NOT NULL)"
+            )
+            logger.debug(f"Embedding cache initialized at {self.cache_dir}")
+        return self._conn
+
+    @staticmethod
+    def _get_key(model: str, text: str) -> str:
+        """
+        Get cache key for a text embedded with a model.
+
+        Args:
+            model: Embedding model name
+            text: Text that was embedded
+
+        Returns:
+            Hex SHA-256 digest of model and text
+        """
+        return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Get cached embeddings for texts.
+
+        Args:
+            model: Embedding model name
+            texts: Texts to look up
+
+        Returns:
+            Embedding for each text, or None where not cached
+        """
+        keys = [self._get_key(model, text) for text in texts]
+        found: Dict[str, List[float]] = {}
+
+        try:
+            conn = self._connection()
+            for i in range(0, len(keys), _QUERY_BATCH_SIZE):
+                batch = keys[i:i + _QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    "SELECT key, scale, vector FROM embeddings "
+                    f"WHERE key IN ({placeholders})",
+                    batch,
+                )
+                for key, scale, vector in rows:
+                    found[key] = _dequantise(scale, vector)
+        except Exception as e:
+            logger.warning(f"Error reading embedding cache: {e}")
+            return [None] * len(texts)
+
+        logger.debug(f"Embedding cache hits: {len(found)}/{len(texts)}")
+        return [found.get(key) for key in keys]
+
+    def set_many(
+        self, model: str, texts: Sequence[str], embeddings: Sequence[Sequence[float]]
+    ) -> None:
+        """
+        Cache embeddings for texts.
+
+        Args:
+            model: Embedding model name
+            texts: Texts that were embedded
+            embeddings: Embedding for each text
+        """
+        rows = [
+            (self._get_key(model, text), *_quantise(embedding))
+            for text, embedding in zip(texts, embeddings)
+        ]
+
+        try:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, scale, vector) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+        except Exception as e:
+            logger.warning(f"Error caching embeddings: {e}")
+
+    def clear(self) -> int:
+        """
+        Clear all cached embeddings.
+
+        Returns:
+            Number of embeddings deleted
+        """
+        conn = self._connection()
+        with conn:
+            count = conn.execute("DELETE FROM embeddings").rowcount
+
+        logger.info(f"Cleared {count} cached embeddings")
+        return count
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with cache stats (total_embeddings, total_size_mb)
+        """
+        conn = self._connection()
+        total = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        db_path = self.cache_dir / "embeddings.db"
+        total_size = db_path.stat().st_size if db_path.exists() else 0
+
+        return {
+            "total_embeddings": total,
+            "total_size_mb": round(total_size / (1024 * 1024), 2)
+        }
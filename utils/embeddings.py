@@ -0,0 +1,146 @@
+"""
+Batched Ollama embedding model.
+
+The stock OllamaEmbedding sends one request per text when embedding a
+batch of chunks. This subclass sends the whole batch to Ollama's
+/api/embed endpoint in a single request, skipping texts already in the
+embedding cache.
+"""
+
+from typing import Any, List, Optional, Union
+
+from llama_index.core.bridge.pydantic import Field, PrivateAttr
+from llama_index.embeddings.ollama import OllamaEmbedding
+
+from utils.embed_cache import EmbeddingCache
+
+
+class BatchedOllamaEmbedding(OllamaEmbedding):
+    """
+    OllamaEmbedding that embeds each batch of texts in one request.
+
+    Batch size is controlled by `embed_batch_size`; llama-index splits
+    larger inputs into batches of that size before calling
+    _get_text_embeddings. If a cache is given, only cache misses are sent
+    to Ollama and their embeddings are written back.
+    """
+
+    keep_alive: Optional[Union[float, str]] = Field(
+        default=None,
+        description="How long the model stays loaded after a request.",
+    )
+
+    _cache: Optional[EmbeddingCache] = PrivateAttr(default=None)
+
+    def __init__(self, cache: Optional[EmbeddingCache] = None, **kwargs: Any) -> None:
+        """
+        Initialise embedding model.
+
+        Args:
+            cache: Optional embedding cache for text (chunk) embeddings
+            **kwargs: Passed through to OllamaEmbedding
+        """
+        super().__init__(**kwargs)
+        self._cache = cache
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "BatchedOllamaEmbedding"
+
+    def get_general_text_embedding(self, texts: str) -> List[float]:
+        """Get Ollama embedding for a single text."""
+        return self._embed([texts])[0]
+
+    async def aget_general_text_embedding(self, prompt: str) -> List[float]:
+        """Asynchronously get Ollama embedding for a single text."""
+        return (await self._aembed([prompt]))[0]
+
+    def get_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """
+        Get query embeddings for several queries in one /api/embed request.
+
+        Query embeddings are not cached, since queries are rarely repeated.
+
+        Args:
+            queries: Queries to embed
+
+        Returns:
+            Embedding for each query
+        """
+        if not queries:
+            return []
+        return self._embed([self._format_query(query) for query in queries])
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get text embeddings, sending cache misses in a single /api/embed request."""
+        formatted_texts = [self._format_text(text) for text in texts]
+
+        if self._cache is None:
+            return self._embed(formatted_texts)
+
+        embeddings = self._cache.get_many(self.model_name, formatted_texts)
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if misses:
+            miss_texts = [formatted_texts[i] for i in misses]
+            miss_embeddings = self._embed(miss_texts)
+            self._cache.set_many(self.model_name, miss_texts, miss_embeddings)
+            for i, embedding in zip(misses, miss_embeddings):
+                embeddings[i] = embedding
+
+        return embeddings
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously get text embeddings, sending cache misses in one request."""
+        formatted_texts = [self._format_text(text) for text in texts]
+
+        if self._cache is None:
+            return await self._aembed(formatted_texts)
+
+        embeddings = self._cache.get_many(self.model_name, formatted_texts)
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if misses:
+            miss_texts = [formatted_texts[i] for i in misses]
+            miss_embeddings = await self._aembed(miss_texts)
+            self._cache.set_many(self.model_name, miss_texts, miss_embeddings)
+            for i, embedding in zip(misses, miss_embeddings):
+                embeddings[i] = embedding
+
+        return embeddings
+
+    def _embed(self, formatted_texts: List[str]) -> List[List[float]]:
+        """
+        Embed already-formatted texts with one /api/embed request.
+
+        Args:
+            formatted_texts: Texts with any text instruction applied
+
+        Returns:
+            Embedding for each text
+        """
+        result = self._client.embed(
+            model=self.model_name,
+            input=formatted_texts,
+            options=self.ollama_additional_kwargs,
+            keep_alive=self.keep_alive,
+        )
+        return list(result.embeddings)
+
+    async def _aembed(self, formatted_texts: List[str]) -> List[List[float]]:
+        """
+        Asynchronously embed already-formatted texts with one /api/embed request.
+
+        Args:
+            formatted_texts: Texts with any text instruction applied
+
+        Returns:
+            Embedding for each text
+        """
+        result = await self._async_client.embed(
+            model=self.model_name,
+            input=formatted_texts,
+            options=self.ollama_additional_kwargs,
+            keep_alive=self.keep_alive,
+        )
+        return list(result.embeddings)
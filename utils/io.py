@@ -0,0 +1,110 @@
+"""
+JSON file I/O helpers.
+
+Uses orjson for reading and writing pipeline JSON files, which is
+considerably faster and allocates less than the stdlib json module, and
+ijson for streaming large files one entry at a time. Pipeline outputs
+are also written one entry at a time to bound peak memory.
+"""
+
+from typing import Any, BinaryIO, Dict, Iterator, Tuple
+
+import ijson
+import orjson
+
+
+def load_json(path: str) -> Any:
+    """
+    Load JSON file.
+    
+    Args:
+        path: Path to JSON file
+        
+    Returns:
+        Parsed JSON content
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        orjson.JSONDecodeError: If file contains invalid JSON
+            (subclass of json.JSONDecodeError)
+    """
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _write_indented(f: BinaryIO, obj: Any, depth: int) -> None:
+    """
+    Write object as indented JSON nested `depth` levels deep.
+    
+    orjson escapes newlines inside strings, so every raw newline in its
+    output is indentation and can be shifted right safely.
+    
+    Args:
+        f: Binary file to write to
+        obj: JSON-serialisable object
+        depth: Nesting depth of the object in the enclosing document
+    """
+    data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if depth:
+        data = data.replace(b"\n", b"\n" + b"  " * depth)
+    f.write(data)
+
+
+def dump_json_streaming(path: str, obj: Dict[str, Any]) -> None:
+    """
+    Write nested dict to JSON file one second-level entry at a time.
+    
+    Produces the same bytes as orjson.dumps(obj, option=OPT_INDENT_2), but
+    only one (level, area) entry is serialised in memory at a time instead
+    of the whole file.
+    
+    Args:
+        path: Path to JSON file
+        obj: Dict of JSON-serialisable values (typically level -> areas)
+    """
+    with open(path, "wb") as f:
+        if not obj:
+            f.write(b"{}")
+            return
+
+        f.write(b"{")
+        for i, (key, value) in enumerate(obj.items()):
+            if i:
+                f.write(b",")
+            f.write(b"\n  " + orjson.dumps(key) + b": ")
+
+            if not isinstance(value, dict) or not value:
+                _write_indented(f, value, 1)
+                continue
+
+            f.write(b"{")
+            for j, (inner_key, inner_value) in enumerate(value.items()):
+                if j:
+                    f.write(b",")
+                f.write(b"\n    " + orjson.dumps(inner_key) + b": ")
+                _write_indented(f, inner_value, 2)
+            f.write(b"\n  }")
+        f.write(b"\n}")
+
+
+def iter_json_items(path: str, prefix: str) -> Iterator[Tuple[str, Any]]:
+    """
+    Stream key-value pairs of the object at `prefix` in a JSON file.
+    
+    Only one value is held in memory at a time, so large files can be
+    processed without loading them whole.
+    
+    Args:
+        path: Path to JSON file
+        prefix: ijson prefix of the object to iterate (e.g. a top-level
+            key; nested keys are joined with ".")
+        
+    Yields:
+        (key, value) pairs of the object at `prefix`
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ijson.JSONError: If file contains invalid JSON
+    """
+    with open(path, "rb") as f:
+        yield from ijson.kvitems(f, prefix)
@@ -0,0 +1,136 @@
+"""
+LLM response caching system.
+
+Provides disk-based caching for raw LLM completions so re-runs with
+identical prompts skip the LLM call entirely.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional
+
+import orjson
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Disk-based cache for LLM responses.
+
+    Caches raw completion strings by a key derived from the model,
+    sampling temperature, and prompt using JSON files.
+    Never expires - manual clearing only via clear() method.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/llm"):
+        """
+        Initialise cache.
+
+        Args:
+            cache_dir: Directory to store cache files
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.debug(f"LLM response cache initialized at {self.cache_dir}")
+
+    @staticmethod
+    def make_key(model: str, temperature: Optional[float], prompt: str) -> str:
+        """
+        Get cache key for a prompt sent to a model.
+
+        Args:
+            model: LLM model name
+            temperature: Sampling temperature (None if model default)
+            prompt: Full prompt text
+
+        Returns:
+            Hex SHA-256 digest of model, temperature, and prompt
+        """
+        return hashlib.sha256(f"{model}|{temperature}|{prompt}".encode()).hexdigest()
+
+    def _get_cache_path(self, key: str) -> Path:
+        """
+        Get cache file path for key.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Path to cache file
+        """
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get cached response for key.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response if exists, None otherwise
+        """
+        cache_path = self._get_cache_path(key)
+
+        if not cache_path.exists():
+            return None
+
+        try:
+            data = orjson.loads(cache_path.read_bytes())
+            logger.debug(f"LLM cache hit: {key}")
+            return data["response"]
+        except Exception as e:
+            logger.warning(f"Error reading LLM cache for '{key}': {e}")
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        """
+        Cache response for key.
+
+        Args:
+            key: Cache key from make_key()
+            response: Raw LLM completion to cache
+        """
+        cache_path = self._get_cache_path(key)
+
+        try:
+            cache_path.write_bytes(orjson.dumps({"response": response}))
+            logger.debug(f"Cached LLM response: {key}")
+        except Exception as e:
+            logger.warning(f"Error caching LLM response '{key}': {e}")
+
+    def clear(self) -> int:
+        """
+        Clear all cached responses.
+
+        Returns:
+            Number of cache files deleted
+        """
+        count = 0
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                cache_file.unlink()
+                count += 1
+            except Exception as e:
+                logger.warning(f"Error deleting cache file {cache_file}: {e}")
+
+        logger.info(f"Cleared {count} cached LLM responses")
+        return count
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with cache stats (total_responses, total_size_mb)
+        """
+        cache_files = list(self.cache_dir.glob("*.json"))
+        total_size = sum(f.stat().st_size for f in cache_files)
+
+        return {
+            "total_responses": len(cache_files),
+            "total_size_mb": round(total_size / (1024 * 1024), 2)
+        }
@@ -2,11 +2,25 @@
 Logging setup for ConQuerX pipeline.
 
 Provides colour-coded console logging and detailed file logging.
+File records are queued and written by a background listener thread, so
+logging calls never block on disk I/O.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+# one queue and background writer per log file, shared by every logger
+_FILE_QUEUES: Dict[str, "queue.Queue[logging.LogRecord]"] = {}
+
+# loggers already set up, keyed by (name, log_file, verbose)
+_CONFIGURED: Dict[Tuple[str, Optional[str], bool], logging.Logger] = {}
+
+# single console handler shared by every logger
+_console_handler: Optional[logging.StreamHandler] = None
 
 
 # colour codes for console output
@@ -30,16 +44,81 @@ class ColouredFormatter(logging.Formatter):
         logging.CRITICAL: LogColours.RED,
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # coloured level names are built once rather than per record
+        self._coloured = {
+            level: f"{colour}{logging.getLevelName(level)}{LogColours.RESET}"
+            for level, colour in self.COLOURS.items()
+        }
+    
     def format(self, record):
-        # add colour to level name
-        levelname = record.levelname
-        if record.levelno in self.COLOURS:
-            levelname_colour = (
-                f"{self.COLOURS[record.levelno]}{levelname}{LogColours.RESET}"
-            )
-            record.levelname = levelname_colour
+        # add colour to level name, restoring it afterwards so other
+        # handlers (e.g. the log file) receive the plain name
+        original = record.levelname
+        record.levelname = self._coloured.get(record.levelno, original)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original
+
+
+def _get_file_queue(log_file: str) -> "queue.Queue[logging.LogRecord]":
+    """
+    Get the record queue for a log file, starting its writer if needed.
+    
+    The listener thread owns the only FileHandler for the file and is
+    stopped (flushing remaining records) at interpreter exit.
+    
+    Args:
+        log_file: Path to log file
+        
+    Returns:
+        Queue feeding the log file's listener
+    """
+    if log_file in _FILE_QUEUES:
+        return _FILE_QUEUES[log_file]
+    
+    file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+    file_handler.setLevel(logging.DEBUG)  # capture all levels in file
+    
+    file_format = "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s"
+    file_formatter = logging.Formatter(
+        file_format,
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    file_handler.setFormatter(file_formatter)
+    
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    _FILE_QUEUES[log_file] = log_queue
+    return log_queue
+
+
+def _get_console_handler() -> logging.StreamHandler:
+    """
+    Get the console handler shared by every logger, creating it if needed.
+    
+    Returns:
+        Colour-formatted stdout handler (INFO level until verbose is requested)
+    """
+    global _console_handler
+    
+    if _console_handler is None:
+        _console_handler = logging.StreamHandler(sys.stdout)
+        _console_handler.setLevel(logging.INFO)
         
-        return super().format(record)
+        console_format = "[%(asctime)s] [%(levelname)s] %(message)s"
+        console_formatter = ColouredFormatter(
+            console_format,
+            datefmt="%H:%M:%S"
+        )
+        _console_handler.setFormatter(console_formatter)
+    
+    return _console_handler
 
 
 def setup_logger(
@@ -50,52 +129,44 @@ def setup_logger(
     """
     Setup logger with console and optional file handlers.
     
-    Console handler uses colour-coded levels and simple format.
-    File handler uses detailed format with timestamps.
+    Console handler uses colour-coded levels and simple format, and is
+    shared by all loggers, so verbose=True switches every module's console
+    output to DEBUG. File handler uses detailed format with timestamps and
+    is fed through a queue, so records are written off the calling thread.
     
     Args:
         name: Logger name (typically __name__ from calling module)
         log_file: Path to log file (default: pipeline.log)
-        verbose: If True, set console to DEBUG level, else INFO
+        verbose: If True, set console to DEBUG level, else leave it as is
+            (INFO unless verbose was requested earlier)
         
     Returns:
         Configured logger instance
     """
+    console_handler = _get_console_handler()
+    if verbose:
+        console_handler.setLevel(logging.DEBUG)
+    
+    key = (name, log_file, verbose)
+    if key in _CONFIGURED:
+        return _CONFIGURED[key]
+    
     # get or create logger
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)  # capture all levels
     
     # avoid duplicate handlers if logger already configured
-    if logger.handlers:
-        return logger
-    
-    # console handler with colour formatting
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_level = logging.DEBUG if verbose else logging.INFO
-    console_handler.setLevel(console_level)
-    
-    console_format = "[%(asctime)s] [%(levelname)s] %(message)s"
-    console_formatter = ColouredFormatter(
-        console_format,
-        datefmt="%H:%M:%S"
-    )
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
-    # file handler with detailed formatting (if log_file specified)
-    if log_file:
-        file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)  # capture all levels in file
+    if not logger.handlers:
+        logger.addHandler(console_handler)
         
-        file_format = "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s"
-        file_formatter = logging.Formatter(
-            file_format,
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-    
-    # prevent propagation to root logger
-    logger.propagate = False
+        # queued file handler with detailed formatting (if log_file specified)
+        if log_file:
+            queue_handler = QueueHandler(_get_file_queue(log_file))
+            queue_handler.setLevel(logging.DEBUG)
+            logger.addHandler(queue_handler)
+        
+        # prevent propagation to root logger
+        logger.propagate = False
     
+    _CONFIGURED[key] = logger
     return logger
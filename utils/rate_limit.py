@@ -0,0 +1,53 @@
+"""
+Async rate limiting.
+
+Provides a token-bucket limiter so concurrent API calls can run in
+parallel while staying within a request-per-second budget.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """
+    Token-bucket rate limiter for asyncio tasks.
+    
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Each acquire() consumes one token, waiting until one is available.
+    """
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Initialise limiter.
+        
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum tokens held, i.e. the allowed burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        # created on first use, so it binds to the loop that runs acquire()
+        # (before Python 3.10, a Lock binds to the loop current at creation)
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self.rate)
@@ -0,0 +1,74 @@
+"""
+In-memory dense retrieval.
+
+Scores every chunk against a query with a single matrix-vector product
+over normalised chunk embeddings. For the few hundred chunks available
+to each question this is far cheaper than building a vector store index.
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    """
+    Scale vectors to unit length along the last axis.
+
+    Zero vectors are left unchanged.
+
+    Args:
+        vectors: Array of shape (..., D)
+
+    Returns:
+        Unit-length vectors of the same shape
+    """
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class ChunkRetriever:
+    """
+    Exact cosine-similarity retriever over a fixed set of text chunks.
+    """
+
+    def __init__(self, chunks: List[str], embeddings: Sequence[Sequence[float]]):
+        """
+        Initialise retriever.
+
+        Args:
+            chunks: Text chunks to retrieve from
+            embeddings: Embedding for each chunk
+        """
+        self.chunks = chunks
+        if chunks:
+            self._matrix = _normalise(np.asarray(embeddings, dtype=np.float32))
+        else:
+            self._matrix = np.empty((0, 0), dtype=np.float32)
+
+    def retrieve(self, query_embedding: Sequence[float], top_k: int) -> List[str]:
+        """
+        Get the chunks most similar to a query.
+
+        Args:
+            query_embedding: Embedding of the query
+            top_k: Maximum number of chunks to return
+
+        Returns:
+            Up to `top_k` chunks, most similar first
+        """
+        if not self.chunks or top_k <= 0:
+            return []
+
+        query = _normalise(np.asarray(query_embedding, dtype=np.float32))
+        scores = self._matrix @ query
+
+        if top_k < len(scores):
+            # select the top-k in linear time, then sort only those
+            top = np.argpartition(-scores, top_k)[:top_k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [self.chunks[i] for i in top]
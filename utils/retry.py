@@ -2,17 +2,139 @@
 Retry utility with exponential backoff.
 
 Provides robust retry logic for operations that may fail temporarily.
+Backoff uses decorrelated jitter: each delay is drawn between the base
+delay and three times the previous delay, which spreads out retries from
+concurrent callers better than fixed exponential steps.
 """
 
+import asyncio
+import functools
+import inspect
 import time
 import random
-from typing import Callable, TypeVar
+from typing import Any, Callable, TypeVar, cast
 
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 T = TypeVar('T')
+F = TypeVar('F', bound=Callable[..., Any])
+
+# private generator, so jitter draws don't contend on the module-level RNG
+_rng = random.Random()
+
+
+def _next_delay(
+    attempt: int, previous: float, base_delay: float, max_delay: float, jitter: bool
+) -> float:
+    """
+    Get the delay before the next retry.
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        previous: Previous delay (base_delay before the first retry)
+        base_delay: Base delay in seconds
+        max_delay: Maximum delay cap in seconds
+        jitter: Use decorrelated jitter instead of plain exponential backoff
+        
+    Returns:
+        Delay in seconds
+    """
+    if not jitter:
+        # exponential backoff: base_delay * (2 ^ attempt)
+        return min(base_delay * (2 ** attempt), max_delay)
+    
+    # decorrelated jitter: random between base and 3x the previous delay
+    return min(max_delay, _rng.uniform(base_delay, previous * 3))
+
+
+def _log_retry(attempt: int, max_retries: int, error: Exception, delay: float) -> None:
+    """
+    Log a failed attempt that will be retried.
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        max_retries: Maximum number of attempts
+        error: Exception raised by the attempt
+        delay: Delay before the next attempt in seconds
+    """
+    logger.warning(
+        f"Attempt {attempt + 1}/{max_retries} failed: {error}. "
+        f"Retrying in {delay:.2f}s..."
+    )
+
+
+def retried(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    jitter: bool = True
+) -> Callable[[F], F]:
+    """
+    Decorator that retries a function with exponential backoff.
+    
+    Works on both plain and coroutine functions; coroutine functions back
+    off with asyncio.sleep so other in-flight requests keep running. The
+    wrapper is built once at decoration time, so calls allocate no
+    closures. With max_retries <= 1 the function is returned unwrapped.
+    
+    Args:
+        max_retries: Maximum number of attempts
+        base_delay: Base delay in seconds for exponential backoff
+        max_delay: Maximum delay cap in seconds
+        jitter: Use decorrelated jitter to prevent thundering herd
+        
+    Returns:
+        Decorator applying the retry logic
+    """
+    def decorator(func: F) -> F:
+        if max_retries <= 1:
+            # a single attempt needs no retry logic
+            return func
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                delay = base_delay
+                for attempt in range(max_retries):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if attempt == max_retries - 1:
+                            raise
+                        
+                        delay = _next_delay(
+                            attempt, delay, base_delay, max_delay, jitter
+                        )
+                        _log_retry(attempt, max_retries, e, delay)
+                        await asyncio.sleep(delay)
+                
+                raise RuntimeError("Retry logic exhausted without raising exception")
+            
+            return cast(F, async_wrapper)
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            delay = base_delay
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_retries - 1:
+                        # last attempt failed, raise the exception
+                        raise
+                    
+                    delay = _next_delay(attempt, delay, base_delay, max_delay, jitter)
+                    _log_retry(attempt, max_retries, e, delay)
+                    time.sleep(delay)
+            
+            # this should never be reached, but mypy needs it
+            raise RuntimeError("Retry logic exhausted without raising exception")
+        
+        return cast(F, wrapper)
+    
+    return decorator
 
 
 def retry_with_backoff(
@@ -23,14 +145,17 @@ def retry_with_backoff(
     jitter: bool = True
 ) -> T:
     """
-    Retry function with exponential backoff and optional jitter.
+    Retry function with exponential backoff and optional (decorrelated) jitter.
+    
+    Call form of retried() for one-off calls; functions called repeatedly
+    should be decorated with retried() instead.
     
     Args:
         func: Function to retry (must take no arguments)
         max_retries: Maximum number of retry attempts
         base_delay: Base delay in seconds for exponential backoff
         max_delay: Maximum delay cap in seconds
-        jitter: Add random jitter to prevent thundering herd
+        jitter: Use decorrelated jitter to prevent thundering herd
         
     Returns:
         Result from successful function call
@@ -38,26 +163,4 @@ def retry_with_backoff(
     Raises:
         Last exception if all retries exhausted
     """
-    for attempt in range(max_retries):
-        try:
-            return func()
-        except Exception as e:
-            if attempt == max_retries - 1:
-                # last attempt failed, raise the exception
-                raise
-            
-            # calculate exponential backoff: base_delay * (2 ^ attempt)
-            delay = min(base_delay * (2 ** attempt), max_delay)
-            
-            # add jitter: random value between 0 and 1 second
-            if jitter:
-                delay += random.uniform(0, 1)
-            
-            logger.warning(
-                f"Attempt {attempt + 1}/{max_retries} failed: {e}. "
-                f"Retrying in {delay:.2f}s..."
-            )
-            time.sleep(delay)
-    
-    # this should never be reached, but mypy needs it
-    raise RuntimeError("Retry logic exhausted without raising exception")
+    return retried(max_retries, base_delay, max_delay, jitter)(func)()
@@ -0,0 +1,189 @@
+"""
+Semantic caching system.
+
+Provides a disk-backed store of embedded texts that answers "have we seen
+something that means the same?" lookups, so near-duplicate inputs (e.g.
+"organic chem" and "organic chemistry") can share one LLM result.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import orjson
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache of texts.
+
+    Stores texts with their normalised embeddings and returns the stored
+    text most similar to a query embedding, if its cosine similarity is at
+    least `threshold`. Search is an exact matrix-vector product, which is
+    fast for the few thousand entries this is used with.
+    Entries are tied to the embedding model that produced them; a cache
+    written by a different model is ignored. New entries are kept in
+    memory until save() is called.
+    Never expires - manual clearing only via clear() method.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        cache_dir: str = ".cache/semantic",
+        threshold: float = 0.92,
+    ):
+        """
+        Initialise cache, loading any stored entries.
+
+        Args:
+            model: Name of the embedding model used for all vectors
+            cache_dir: Directory to store cache files
+            threshold: Minimum cosine similarity for a cache hit
+        """
+        self.model = model
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self._texts: List[str] = []
+        # row buffer grown by doubling; only the first len(_texts) rows are used
+        self._vectors: Optional[np.ndarray] = None
+        self._load()
+        logger.debug(
+            f"Semantic cache initialized at {self.cache_dir} "
+            f"({len(self._texts)} entries)"
+        )
+
+    @property
+    def _texts_path(self) -> Path:
+        return self.cache_dir / "texts.json"
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.cache_dir / "vectors.npy"
+
+    def _load(self) -> None:
+        """Load stored entries, ignoring them if written by another model."""
+        if not self._texts_path.exists() or not self._vectors_path.exists():
+            return
+
+        try:
+            data = orjson.loads(self._texts_path.read_bytes())
+            if data["model"] != self.model:
+                logger.debug("Semantic cache built with another model, ignoring it")
+                return
+            vectors = np.load(self._vectors_path)
+            if len(vectors) != len(data["texts"]):
+                raise ValueError("text and vector counts differ")
+            self._texts = data["texts"]
+            self._vectors = vectors
+        except Exception as e:
+            logger.warning(f"Error reading semantic cache: {e}")
+
+    def save(self) -> None:
+        """Write all entries to disk."""
+        if self._vectors is None:
+            return
+
+        try:
+            self._texts_path.write_bytes(
+                orjson.dumps({"model": self.model, "texts": self._texts})
+            )
+            np.save(self._vectors_path, self._vectors[:len(self._texts)])
+        except Exception as e:
+            logger.warning(f"Error writing semantic cache: {e}")
+
+    @staticmethod
+    def _normalise(vector: Sequence[float]) -> np.ndarray:
+        """
+        Scale vector to unit length.
+
+        Args:
+            vector: Embedding vector
+
+        Returns:
+            Unit-length float32 vector (unchanged if all zeros)
+        """
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def get(self, vector: Sequence[float]) -> Optional[str]:
+        """
+        Get the stored text most similar to an embedding.
+
+        Args:
+            vector: Query embedding
+
+        Returns:
+            Most similar stored text if similarity >= threshold, None otherwise
+        """
+        if self._vectors is None or not self._texts:
+            return None
+
+        scores = self._vectors[:len(self._texts)] @ self._normalise(vector)
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        logger.debug(f"Semantic cache hit: {self._texts[best]} ({scores[best]:.3f})")
+        return self._texts[best]
+
+    def set(self, text: str, vector: Sequence[float]) -> None:
+        """
+        Store text with its embedding in memory.
+
+        Call save() to persist new entries.
+
+        Args:
+            text: Text that was embedded
+            vector: Embedding of the text
+        """
+        row = self._normalise(vector)
+        size = len(self._texts)
+        if self._vectors is None:
+            self._vectors = np.empty((8, row.shape[0]), dtype=np.float32)
+        elif size == len(self._vectors):
+            grown = np.empty((max(2 * size, 8), row.shape[0]), dtype=np.float32)
+            grown[:size] = self._vectors
+            self._vectors = grown
+        self._vectors[size] = row
+        self._texts.append(text)
+
+    def clear(self) -> int:
+        """
+        Clear all stored entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        count = len(self._texts)
+        self._texts = []
+        self._vectors = None
+        for path in (self._texts_path, self._vectors_path):
+            path.unlink(missing_ok=True)
+
+        logger.info(f"Cleared {count} semantic cache entries")
+        return count
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with cache stats (total_entries, total_size_mb)
+        """
+        total_size = sum(
+            path.stat().st_size
+            for path in (self._texts_path, self._vectors_path)
+            if path.exists()
+        )
+
+        return {
+            "total_entries": len(self._texts),
+            "total_size_mb": round(total_size / (1024 * 1024), 2)
+        }
@@ -11,6 +11,12 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# valid sanitised area names: letters, spaces, and common punctuation
+_AREA_RE = re.compile(r'^[a-z\s\-&]+$')
+
+# quiz options, in the order a well-formed quiz lists them
+_QUIZ_OPTIONS = ('A.', 'B.', 'C.', 'D.')
+
 
 def sanitise_area_name(area: str) -> str:
     """
@@ -31,7 +37,7 @@ def sanitise_area_name(area: str) -> str:
     sanitised = area.replace("_", " ").lower().strip()
     
     # validate contains only letters, spaces, and common punctuation
-    if not re.match(r'^[a-z\s\-&]+$', sanitised):
+    if not _AREA_RE.match(sanitised):
         raise ValueError(f"Invalid area name: {area}")
     
     return sanitised
@@ -48,10 +54,10 @@ def validate_questions(questions: List[str], min_count: int = 3) -> List[str]:
         min_count: Minimum expected number of questions
         
     Returns:
-        Filtered list of valid questions
+        Filtered list of valid questions (stripped)
     """
-    # filter out empty or whitespace-only questions
-    valid_questions = [q for q in questions if q and q.strip()]
+    # strip and drop empty or whitespace-only questions in one pass
+    valid_questions = [s for s in (q.strip() for q in questions if q) if s]
     
     if len(valid_questions) < min_count:
         logger.warning(
@@ -82,7 +88,8 @@ def validate_concepts(concepts: List[str]) -> List[str]:
             continue
             
         # concepts should be nouns/phrases, not full sentences
-        if len(concept.split()) > 10:
+        # (more than 10 words; counting spaces avoids building a list)
+        if concept.count(' ') >= 10:
             logger.warning(f"Concept seems too long, might be malformed: {concept[:50]}...")
             continue
             
@@ -111,13 +118,24 @@ def validate_quiz_format(quiz_text: str) -> bool:
     Returns:
         True if valid format, False otherwise
     """
+    # fast path: options in order, found with one linear left-to-right scan
+    if quiz_text.startswith("Quiz:"):
+        position = 0
+        for option in _QUIZ_OPTIONS:
+            position = quiz_text.find(option, position)
+            if position < 0:
+                break
+            position += len(option)
+        else:
+            return True
+    
+    # slow path keeps the specific warnings (and accepts unordered options)
     if not quiz_text.startswith("Quiz:"):
         logger.warning("Quiz doesn't start with 'Quiz:'")
         return False
     
     # check for options A, B, C, D
-    required_options = ['A.', 'B.', 'C.', 'D.']
-    for option in required_options:
+    for option in _QUIZ_OPTIONS:
         if option not in quiz_text:
             logger.warning(f"Quiz missing option {option}")
             return False
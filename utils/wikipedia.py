@@ -0,0 +1,116 @@
+"""
+Async Wikipedia client.
+
+Fetches plain-text page extracts from the MediaWiki API over a single
+pooled aiohttp session, so concurrent fetches reuse kept-alive
+connections instead of opening a new one per page.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+from utils.logger import setup_logger
+from utils.rate_limit import AsyncTokenBucket
+
+logger = setup_logger(__name__)
+
+# page id reported for missing pages, as in the Wikipedia-API package
+MISSING_PAGE_ID = "-1"
+
+
+class AsyncWikipediaClient:
+    """
+    Minimal async client for Wikipedia page text.
+
+    Requests share one session (created lazily on the running event loop)
+    whose connector caps concurrent connections, and one token bucket
+    that caps the request rate. Call close() when done.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        language: str = "en",
+        rate_limit: float = 10.0,
+        concurrency: int = 8,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialise client.
+
+        Args:
+            user_agent: User-Agent header identifying the application
+            language: Wikipedia language edition
+            rate_limit: Maximum requests per second
+            concurrency: Maximum open connections
+            timeout: Total timeout per request in seconds
+        """
+        self.api_url = f"https://{language}.wikipedia.org/w/api.php"
+        self.user_agent = user_agent
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._limiter = AsyncTokenBucket(rate=rate_limit)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it if needed.
+
+        Returns:
+            Open aiohttp session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.concurrency, keepalive_timeout=60
+                ),
+                headers={"User-Agent": self.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def page(self, title: str) -> Tuple[str, str]:
+        """
+        Fetch the plain-text content of a page.
+
+        Redirects are followed. Missing pages return MISSING_PAGE_ID and
+        empty content.
+
+        Args:
+            title: Page title
+
+        Returns:
+            Tuple of (page_id, page_content)
+
+        Raises:
+            aiohttp.ClientError: If the request fails
+        """
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "prop": "extracts",
+            "explaintext": "1",
+            "redirects": "1",
+            "titles": title,
+        }
+
+        await self._limiter.acquire()
+        session = self._get_session()
+        async with session.get(self.api_url, params=params) as response:
+            response.raise_for_status()
+            data: Dict[str, Any] = await response.json()
+
+        pages = data.get("query", {}).get("pages", [])
+        if not pages or pages[0].get("missing"):
+            logger.debug(f"Wikipedia page not found: {title}")
+            return MISSING_PAGE_ID, ""
+
+        return str(pages[0]["pageid"]), pages[0].get("extract", "")
+
+    async def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None